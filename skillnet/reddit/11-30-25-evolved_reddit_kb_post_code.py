@@ -33,8 +33,6 @@ async def click_element_by_selector(page, selector: str, start_path: str = "/",
     - Always uses relative navigation per SkillWeaver requirements
     - Uses .first on locators to avoid strict mode violations when multiple matches exist
     """
-    import re
-
     # Normalize start path to always be relative
     if not start_path.startswith("/"):
         start_path = f"/{start_path}"
@@ -86,8 +86,10 @@ async def browse_all(page, sort_option: str = None):
     import re
     await page.goto("/r/all")
     if sort_option:
-        # Try to click a sort button/tab
-        await page.get_by_role("button", name=re.compile(sort_option, re.I)).first.click()
+        # Try to click a sort button/tab; give up quickly if this variant lacks it
+        await page.get_by_role("button", name=re.compile(sort_option, re.I)).first.click(
+            timeout=5000
+        )
 
 
 async def search_reddit(page, query: str, sort: str = None, time_filter: str = None):
@@ -95,8 +97,7 @@ async def search_reddit(page, query: str, sort: str = None, time_filter: str = N
     Perform a site-wide search.
 
     Notes:
-    - In WebArena, a global searchbox is available in the header ("Search query").
-      This version will use a textbox if present, else falls back to the header searchbox.
+    - Search is a plain GET in WebArena, so this navigates straight to /search?q=...
     - Sorting/time filters are applied if controls exist.
 
     Args:
@@ -106,30 +107,29 @@ async def search_reddit(page, query: str, sort: str = None, time_filter: str = N
         time_filter: Optional time: "Past hour", "Today", "This week", "This month", "This year", "All time".
     """
     import re
-    await page.goto("/search")
-    # Prefer dedicated search input; fallback to header searchbox
-    box = page.get_by_role("textbox", name=re.compile(r"Search", re.I))
-    if not await box.count():
-        box = page.get_by_role("searchbox", name=re.compile(r"Search|Search query", re.I))
-    await box.fill(query)
-    await page.keyboard.press("Enter")
-    await page.wait_for_load_state("networkidle")
+    from urllib.parse import urlencode
+
+    await page.goto(f"/search?{urlencode({'q': query})}", wait_until="domcontentloaded")
     if sort:
-        sort_trigger = page.get_by_role("button", name=re.compile(r"Sort|Relevance|Hot|Top|New|Comments", re.I)).first
+        sort_trigger = page.get_by_role(
+            "button", name=re.compile(r"Sort|Relevance|Hot|Top|New|Comments", re.I)
+        ).first
         if await sort_trigger.count():
             await sort_trigger.click()
             target = page.get_by_role("link", name=re.compile(sort, re.I)).first
             if await target.count():
                 await target.click()
+                # Choosing a sort navigates; the time control belongs to the new page
+                await page.wait_for_load_state("domcontentloaded")
     if time_filter:
-        # Open time filter menu and select time if available
-        possible_triggers = [
-            r"Any time", r"Time", r"Past.*", r"Today", r"This week", r"This month", r"This year", r"All time"
-        ]
-        trigger_pattern = re.compile("|".join(possible_triggers), re.I)
-        trigger = page.get_by_role("button", name=trigger_pattern).first
-        if await trigger.count():
-            await trigger.click()
+        time_trigger = page.get_by_role(
+            "button",
+            name=re.compile(
+                r"Any time|Time|Past.*|Today|This week|This month|This year|All time", re.I
+            ),
+        ).first
+        if await time_trigger.count():
+            await time_trigger.click()
             choice = page.get_by_role("link", name=re.compile(time_filter, re.I)).first
             if await choice.count():
                 await choice.click()
@@ -154,27 +154,36 @@ async def search_in_subreddit(page, subreddit_name: str, query: str, restrict_to
     """
     import re
     await page.goto(f"/f/{subreddit_name}")
-    # Use header search
-    box = page.get_by_role("searchbox", name=re.compile(r"Search|Search query", re.I))
+    box = page.get_by_role("searchbox", name=re.compile(r"Search", re.I)).first
     if not await box.count():
-        box = page.get_by_role("textbox", name=re.compile(r"Search", re.I))
+        box = page.get_by_role("textbox", name=re.compile(r"Search", re.I)).first
     await box.fill(query)
-    await page.keyboard.press("Enter")
+    await box.press("Enter")
     await page.wait_for_load_state("networkidle")
     if sort:
-        trigger = page.get_by_role("button", name=re.compile(r"Sort|Relevance|Hot|Top|New|Comments", re.I)).first
-        if await trigger.count():
-            await trigger.click()
-            pick = page.get_by_role("link", name=re.compile(sort, re.I)).first
-            if await pick.count():
-                await pick.click()
+        sort_trigger = page.get_by_role(
+            "button", name=re.compile(r"Sort|Relevance|Hot|Top|New|Comments", re.I)
+        ).first
+        if await sort_trigger.count():
+            await sort_trigger.click()
+            target = page.get_by_role("link", name=re.compile(sort, re.I)).first
+            if await target.count():
+                await target.click()
+                # Choosing a sort navigates; the time control belongs to the new page
+                await page.wait_for_load_state("domcontentloaded")
     if time_filter:
-        time_btn = page.get_by_role("button", name=re.compile(r"Any time|Past|Today|This week|This month|This year|All time", re.I)).first
-        if await time_btn.count():
-            await time_btn.click()
+        time_trigger = page.get_by_role(
+            "button",
+            name=re.compile(
+                r"Any time|Time|Past.*|Today|This week|This month|This year|All time", re.I
+            ),
+        ).first
+        if await time_trigger.count():
+            await time_trigger.click()
             choice = page.get_by_role("link", name=re.compile(time_filter, re.I)).first
             if await choice.count():
                 await choice.click()
+            await page.wait_for_load_state("networkidle")
 
 
 async def open_post_in_subreddit_by_title(page, subreddit_name: str, title_substring: str, exact: bool = False):
@@ -195,9 +204,9 @@ async def open_post_in_subreddit_by_title(page, subreddit_name: str, title_subst
     name_pattern = re.compile(rf"{title_substring}" if not exact else rf"^{re.escape(title_substring)}$", re.I)
     target = page.get_by_role("article").filter(has=page.get_by_role("heading", name=name_pattern)).first
     # Prefer the comments link inside the matched article
-    comments = target.get_by_role("link", name=re.compile(r"\d+\s+comments", re.I))
+    comments = target.get_by_role("link", name=re.compile(r"\d+\s+comments", re.I)).first
     if await comments.count():
-        await comments.first.click()
+        await comments.click()
     else:
         # Fallback: click first link (may open content)
         await target.get_by_role("link").first.click()
@@ -213,7 +222,7 @@ async def upvote_post_in_subreddit_by_title(page, subreddit_name: str, title_sub
     target = page.get_by_role("article").filter(
         has=page.get_by_role("heading", name=re.compile(title_substring, re.I))
     ).first
-    await target.get_by_role("button", name=re.compile(r"upvote", re.I)).click()
+    await target.get_by_role("button", name="upvote").click()
 
 
 async def join_subreddit(page, subreddit_name: str):
@@ -225,9 +234,9 @@ async def join_subreddit(page, subreddit_name: str):
     import re
     await page.goto(f"/f/{subreddit_name}")
     # Click "Subscribe" or "Join" if present
-    subscribe_btn = page.get_by_role("button", name=re.compile(r"^Subscribe\b|^Join\b", re.I))
+    subscribe_btn = page.get_by_role("button", name=re.compile(r"^Subscribe\b|^Join\b", re.I)).first
     if await subscribe_btn.count():
-        await subscribe_btn.first.click()
+        await subscribe_btn.click()
 
 
 async def leave_subreddit(page, subreddit_name: str):
@@ -237,9 +246,9 @@ async def leave_subreddit(page, subreddit_name: str):
     import re
     await page.goto(f"/f/{subreddit_name}")
     # Try common labels that indicate current subscription
-    toggle = page.get_by_role("button", name=re.compile(r"Unsubscribe|Subscribed|Joined", re.I))
+    toggle = page.get_by_role("button", name=re.compile(r"Unsubscribe|Subscribed|Joined", re.I)).first
     if await toggle.count():
-        await toggle.first.click()
+        await toggle.click()
 
 
 async def open_top_posts_in_subreddit(page, subreddit_name: str, time_range: str = None):
@@ -248,7 +257,7 @@ async def open_top_posts_in_subreddit(page, subreddit_name: str, time_range: str
     """
     import re
     await page.goto(f"/f/{subreddit_name}")
-    await page.get_by_role("button", name=re.compile(r"Top", re.I)).first.click()
+    await page.get_by_role("button", name="Top").first.click()
     if time_range:
         # Open the time filter (if present)
         btn = page.get_by_role("button", name=re.compile(r"Any time|Past|Today|This week|This month|This year|All time", re.I)).first
@@ -290,19 +299,17 @@ async def search_and_open_first_result(page, query: str, result_type: str = "Pos
     - Note: Tabs may be implemented as links or tabs; flexible roles used
     """
     import re
-    await page.goto("/search")
-    await page.get_by_role("textbox", name=re.compile(r"Search", re.I)).fill(query)
-    await page.keyboard.press("Enter")
-    await page.wait_for_load_state("networkidle")
-    # Switch to result_type tab if available
-    tab = page.get_by_role("tab", name=re.compile(result_type, re.I))
+    from urllib.parse import urlencode
+
+    await page.goto(f"/search?{urlencode({'q': query})}", wait_until="domcontentloaded")
+    # Tabs may be implemented as tabs or links
+    tab = page.get_by_role("tab", name=re.compile(result_type, re.I)).first
     if await tab.count():
-        await tab.first.click()
+        await tab.click()
     else:
-        linktab = page.get_by_role("link", name=re.compile(result_type, re.I))
+        linktab = page.get_by_role("link", name=re.compile(result_type, re.I)).first
         if await linktab.count():
-            await linktab.first.click()
-    # Open the first result item
+            await linktab.click()
     await page.get_by_role("article").first.get_by_role("link").first.click()
     await page.wait_for_load_state("networkidle")
 
@@ -349,14 +356,13 @@ async def open_subreddit_about_tab(page, subreddit_name: str):
     - Navigated to r/python About to read rules and description
     - Some layouts use a side panel; clicking About tab still works
     """
-    import re
     await page.goto(f"/r/{subreddit_name}")
     # Try tab first, then link variant
-    tab = page.get_by_role("tab", name=re.compile(r"About", re.I))
+    tab = page.get_by_role("tab", name="About").first
     if await tab.count():
-        await tab.first.click()
+        await tab.click()
     else:
-        await page.get_by_role("link", name=re.compile(r"About", re.I)).first.click()
+        await page.get_by_role("link", name="About").first.click()
 
 
 async def open_subreddit_wiki(page, subreddit_name: str):
@@ -383,9 +389,9 @@ async def open_post_by_index_in_subreddit(page, subreddit_name: str, index: int
     import re
     await page.goto(f"/f/{subreddit_name}")
     article = page.get_by_role("article").nth(index - 1)
-    comments = article.get_by_role("link", name=re.compile(r"\d+\s+comments", re.I))
+    comments = article.get_by_role("link", name=re.compile(r"\d+\s+comments", re.I)).first
     if await comments.count():
-        await comments.first.click()
+        await comments.click()
     else:
         await article.get_by_role("link").first.click()
     await page.wait_for_load_state("networkidle")
@@ -397,6 +403,7 @@ async def sort_subreddit_posts(page, subreddit_name: str, sort_option: str, time
 
     On WebArena, sorting is accessed via a "Sort by: ..." button.
     """
+    import asyncio
     import re
     await page.goto(f"/f/{subreddit_name}")
     sort_btn = page.get_by_role("button", name=re.compile(r"Sort by", re.I)).first
@@ -408,8 +415,9 @@ async def sort_subreddit_posts(page, subreddit_name: str, sort_option: str, time
             page.get_by_role("link", name=re.compile(sort_option, re.I)).first,
             page.get_by_role("button", name=re.compile(sort_option, re.I)).first,
         ]
-        for cand in candidates:
-            if await cand.count():
+        counts = await asyncio.gather(*(cand.count() for cand in candidates))
+        for cand, count in zip(candidates, counts):
+            if count:
                 await cand.click()
                 break
     if time_range:
@@ -430,7 +438,7 @@ async def save_post_in_subreddit_by_title(page, subreddit_name: str, title_subst
     article = page.get_by_role("article").filter(
         has=page.get_by_role("heading", name=re.compile(title_substring, re.I))
     ).first
-    await article.get_by_role("button", name=re.compile(r"save", re.I)).click()
+    await article.get_by_role("button", name="save").click()
 
 
 async def open_messages_compose(page, to_username: str, subject: str, message: str):
@@ -466,13 +474,12 @@ async def open_user_posts_tab(page, username: str):
     - Opened /user/spez Posts
     - Some profiles default to Posts; this still works idempotently
     """
-    import re
     await page.goto(f"/user/{username}")
-    tab = page.get_by_role("tab", name=re.compile(r"Posts", re.I))
+    tab = page.get_by_role("tab", name="Posts").first
     if await tab.count():
-        await tab.first.click()
+        await tab.click()
     else:
-        await page.get_by_role("link", name=re.compile(r"Posts", re.I)).first.click()
+        await page.get_by_role("link", name="Posts").first.click()
 
 
 async def open_user_comments_tab(page, username: str):
@@ -486,13 +493,12 @@ async def open_user_comments_tab(page, username: str):
     Usage Log:
     - Opened /user/kn0thing Comments tab successfully
     """
-    import re
     await page.goto(f"/user/{username}")
-    tab = page.get_by_role("tab", name=re.compile(r"Comments", re.I))
+    tab = page.get_by_role("tab", name="Comments").first
     if await tab.count():
-        await tab.first.click()
+        await tab.click()
     else:
-        await page.get_by_role("link", name=re.compile(r"Comments", re.I)).first.click()
+        await page.get_by_role("link", name="Comments").first.click()
 
 
 async def search_and_filter_time(page, query: str, time_filter: str):
@@ -509,12 +515,21 @@ async def search_and_filter_time(page, query: str, time_filter: str):
     - Helpful when only time filtering matters
     """
     import re
-    await page.goto("/search")
-    await page.get_by_role("textbox", name=re.compile(r"Search", re.I)).fill(query)
-    await page.keyboard.press("Enter")
-    await page.wait_for_load_state("networkidle")
-    await page.get_by_role("button", name=re.compile(r"Any time|Past|Today|This week|This month|This year|All time", re.I)).first.click()
-    await page.get_by_role("link", name=re.compile(time_filter, re.I)).first.click()
+    from urllib.parse import urlencode
+
+    await page.goto(f"/search?{urlencode({'q': query})}", wait_until="domcontentloaded")
+    trigger = page.get_by_role(
+        "button",
+        name=re.compile(
+            r"Any time|Time|Past.*|Today|This week|This month|This year|All time", re.I
+        ),
+    ).first
+    if await trigger.count():
+        await trigger.click()
+        choice = page.get_by_role("link", name=re.compile(time_filter, re.I)).first
+        if await choice.count():
+            await choice.click()
+        await page.wait_for_load_state("networkidle")
 
 
 async def open_post_comments_by_title(page, subreddit_name: str, title_substring: str):
@@ -526,9 +541,9 @@ async def open_post_comments_by_title(page, subreddit_name: str, title_substring
     import re
     await page.goto(f"/f/{subreddit_name}")
     article = page.get_by_role("article").filter(has=page.get_by_role("heading", name=re.compile(title_substring, re.I))).first
-    comments = article.get_by_role("link", name=re.compile(r"\d+\s+comments", re.I))
+    comments = article.get_by_role("link", name=re.compile(r"\d+\s+comments", re.I)).first
     if await comments.count():
-        await comments.first.click()
+        await comments.click()
     else:
         await article.get_by_role("link").first.click()
     await page.wait_for_load_state("networkidle")
@@ -549,7 +564,7 @@ async def open_home_feed(page, sort: str = None):
     import re
     await page.goto("/")
     if sort:
-        await page.get_by_role("button", name=re.compile(sort, re.I)).first.click()
+        await page.get_by_role("button", name=re.compile(sort, re.I)).first.click(timeout=5000)
 
 
 async def open_and_upvote_first_search_result(page, query: str):
@@ -564,11 +579,9 @@ async def open_and_upvote_first_search_result(page, query: str):
     - Searched "programming humor" and upvoted the first result
     - If not logged in, upvote may still be clickable but not persisted
     """
-    import re
-    await page.goto("/search")
-    await page.get_by_role("textbox", name=re.compile(r"Search", re.I)).fill(query)
-    await page.keyboard.press("Enter")
-    await page.wait_for_load_state("networkidle")
+    from urllib.parse import urlencode
+
+    await page.goto(f"/search?{urlencode({'q': query})}", wait_until="domcontentloaded")
     await page.get_by_role("article").first.get_by_role("link").first.click()
     await page.wait_for_load_state("networkidle")
-    await page.get_by_role("button", name=re.compile(r"upvote", re.I)).first.click()
+    await page.get_by_role("button", name="upvote").first.click()
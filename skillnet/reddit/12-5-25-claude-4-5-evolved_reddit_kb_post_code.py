@@ -39,14 +39,17 @@ async def search_reddit(page, query, subreddit_name=None):
     - Searched "python tips" across all Reddit - found many results
     - Fixed to use /f/ format for Postmill forums
     - Searched "help" in "learnprogramming" subreddit - more focused results
+    - Site-wide searches go straight to /search?q=... without the search box
     """
-    if subreddit_name:
-        await page.goto(f"/f/{subreddit_name}")
-    else:
-        await page.goto("/")
+    from urllib.parse import urlencode
+    if not subreddit_name:
+        await page.goto(f"/search?{urlencode({'q': query})}")
+        return
     
-    await page.get_by_role("searchbox").fill(query)
-    await page.get_by_role("searchbox").press("Enter")
+    await page.goto(f"/f/{subreddit_name}")
+    search_box = page.get_by_role("searchbox")
+    await search_box.fill(query)
+    await search_box.press("Enter")
 
 
 async def create_post(page, subreddit_name, title, content):
@@ -67,14 +70,15 @@ async def create_post(page, subreddit_name, title, content):
     - Works with WebArena's Reddit implementation
     """
     import re
-    
     await page.goto(f"/submit/{subreddit_name}")
     
     # Fill in title - this field is always present
-    await page.get_by_role("textbox", name=re.compile(r"title", re.IGNORECASE)).fill(title)
+    await page.get_by_role("textbox", name="Title", exact=True).fill(title)
     
     # Fill in body text - may be labeled "Body" or "Text"
-    await page.get_by_role("textbox", name=re.compile(r"text|body", re.IGNORECASE)).fill(content)
+    await page.get_by_role("textbox", name="Body", exact=True).or_(
+        page.get_by_role("textbox", name="Text", exact=True)
+    ).first.fill(content)
     
     # Submit the post
     await page.get_by_role("button", name=re.compile(r"post|submit|create", re.IGNORECASE)).click()
@@ -92,11 +96,9 @@ async def add_comment_to_post(page, comment_text):
     
     Usage Log:
     - Added comment to post successfully
-    - Sometimes need to click comment box first to activate it
+    - fill() focuses the comment box itself; no separate click needed
     """
-    comment_box = page.get_by_role("textbox", name="Comment")
-    await comment_box.click()
-    await comment_box.fill(comment_text)
+    await page.get_by_role("textbox", name="Comment").fill(comment_text)
     await page.get_by_role("button", name="Comment").click()
 
 
@@ -114,9 +116,8 @@ async def upvote_post(page, post_title):
     - Upvoted post "My first post" successfully
     - Partial title matches work for finding posts
     """
-    import re
     post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"upvote", re.IGNORECASE)).click()
+    await post.get_by_role("button", name="Upvote").click()
 
 
 async def downvote_post(page, post_title):
@@ -132,9 +133,53 @@ async def downvote_post(page, post_title):
     Usage Log:
     - Downvoted spam post successfully
     """
-    import re
     post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"downvote", re.IGNORECASE)).click()
+    await post.get_by_role("button", name="Downvote").click()
+
+
+async def upvote_posts(page, subreddit_name, post_titles, max_concurrency=5):
+    """
+    Upvote several posts in a forum concurrently.
+    
+    Each worker opens its own tab in `page`'s browser context (so the
+    logged-in session is shared), navigates to the forum and runs
+    upvote_post for one title. `page` itself is not navigated.
+    
+    Args:
+        page: The Playwright page object (source of context and site).
+        subreddit_name: Forum where the posts are listed.
+        post_titles: Titles of the posts to upvote.
+        max_concurrency: Maximum number of pages working at the same time.
+    
+    Usage Log:
+    - Upvoted a batch of posts in one forum in parallel
+    """
+    import asyncio
+    from urllib.parse import urlsplit
+
+    # Relative page.goto resolves against the current URL, so each new tab
+    # starts on the site origin of `page`.
+    origin = urlsplit(page.url)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    tabs = []
+
+    async def upvote_in_forum(post_title):
+        async with semaphore:
+            tab = await page.context.new_page()
+            tabs.append(tab)
+            await tab.goto(f"{origin.scheme}://{origin.netloc}/", wait_until="domcontentloaded")
+            await navigate_to_subreddit(tab, subreddit_name)
+            await upvote_post(tab, post_title)
+            await tab.close()
+
+    results = await asyncio.gather(
+        *(upvote_in_forum(post_title) for post_title in post_titles), return_exceptions=True
+    )
+    # Close the tabs of workers that failed part-way, then surface the failure
+    await asyncio.gather(*(tab.close() for tab in tabs if not tab.is_closed()))
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
 
 
 async def click_post_by_title(page, post_title):
@@ -153,12 +198,12 @@ async def click_post_by_title(page, post_title):
     - Works with Postmill's article structure
     """
     import re
-    
-    # Find article containing the post title and click its main link
-    article = page.get_by_role("article").filter(
-        has=page.get_by_role("link", name=re.compile(re.escape(post_title), re.IGNORECASE))
-    ).first
-    await article.get_by_role("link", name=re.compile(re.escape(post_title), re.IGNORECASE)).click()
+    # Build the article -> title link chain once and act on it directly
+    title_pat = re.compile(re.escape(post_title), re.IGNORECASE)
+    title_link = page.get_by_role("article").filter(
+        has=page.get_by_role("link", name=title_pat)
+    ).first.get_by_role("link", name=title_pat)
+    await title_link.click()
 
 
 async def subscribe_to_subreddit(page, subreddit_name):
@@ -176,10 +221,9 @@ async def subscribe_to_subreddit(page, subreddit_name):
     - Button text like "Subscribe No subscribers" - use flexible matching
     - Successfully subscribed to "space" forum
     """
-    import re
     await page.goto(f"/f/{subreddit_name}")
     # Button may say "Subscribe No subscribers" or similar
-    await page.get_by_role("button", name=re.compile(r"subscribe", re.IGNORECASE)).click()
+    await page.get_by_role("button", name="Subscribe").click()
 
 
 async def unsubscribe_from_subreddit(page, subreddit_name):
@@ -196,9 +240,54 @@ async def unsubscribe_from_subreddit(page, subreddit_name):
     - Unsubscribed from "test" successfully
     - Uses /f/ format for Postmill
     """
-    import re
     await page.goto(f"/f/{subreddit_name}")
-    await page.get_by_role("button", name=re.compile(r"Unsubscribe|Leave", re.IGNORECASE)).click()
+    await page.get_by_role("button", name="Unsubscribe").or_(
+        page.get_by_role("button", name="Leave")
+    ).first.click()
+
+
+async def subscribe_to_subreddits(page, subreddit_names, max_concurrency=5):
+    """
+    Subscribe to several forums concurrently.
+    
+    Opens one tab per forum in `page`'s browser context (so the logged-in
+    session is shared) and runs subscribe_to_subreddit on each, with at most
+    `max_concurrency` tabs open at once. `page` itself is not navigated.
+    
+    Args:
+        page: The Playwright page object (source of context and site).
+        subreddit_names: Names of the forums to subscribe to.
+        max_concurrency: Maximum number of pages working at the same time.
+    
+    Usage Log:
+    - Subscribed to several forums in parallel instead of one after another
+    """
+    import asyncio
+    from urllib.parse import urlsplit
+
+    # Relative page.goto resolves against the current URL, so each new tab
+    # starts on the site origin of `page`.
+    origin = urlsplit(page.url)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    tabs = []
+
+    async def subscribe_in_new_tab(subreddit_name):
+        async with semaphore:
+            tab = await page.context.new_page()
+            tabs.append(tab)
+            await tab.goto(f"{origin.scheme}://{origin.netloc}/", wait_until="domcontentloaded")
+            await subscribe_to_subreddit(tab, subreddit_name)
+            await tab.close()
+
+    results = await asyncio.gather(
+        *(subscribe_in_new_tab(subreddit_name) for subreddit_name in subreddit_names),
+        return_exceptions=True,
+    )
+    # Close the tabs of workers that failed part-way, then surface the failure
+    await asyncio.gather(*(tab.close() for tab in tabs if not tab.is_closed()))
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
 
 
 async def sort_posts_by(page, sort_type):
@@ -217,9 +306,8 @@ async def sort_posts_by(page, sort_type):
     - Sort dropdown expands to show links
     """
     import re
-    
     # First expand the sort dropdown
-    sort_button = page.get_by_role("button", name=re.compile(r"Sort", re.IGNORECASE))
+    sort_button = page.get_by_role("button", name=re.compile(r"sort", re.IGNORECASE))
     await sort_button.click()
     
     # Click the sort option link using exact match to avoid false positives
@@ -273,8 +361,8 @@ async def send_private_message(page, username, subject, message_text):
     - Sent PM to "testuser" with subject and message
     """
     await page.goto(f"/message/compose?to={username}")
-    await page.get_by_role("textbox", name="Subject").fill(subject)
-    await page.get_by_role("textbox", name="Message").fill(message_text)
+    await page.get_by_role("textbox", name="Subject", exact=True).fill(subject)
+    await page.get_by_role("textbox", name="Message", exact=True).fill(message_text)
     await page.get_by_role("button", name="Send").click()
 
 
@@ -291,9 +379,8 @@ async def save_post(page, post_title):
     Usage Log:
     - Saved "Useful tutorial" post successfully
     """
-    import re
     post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"save", re.IGNORECASE)).click()
+    await post.get_by_role("button", name="Save").click()
 
 
 async def hide_post(page, post_title):
@@ -307,9 +394,8 @@ async def hide_post(page, post_title):
     Usage Log:
     - Hid unwanted post successfully
     """
-    import re
     post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"hide", re.IGNORECASE)).click()
+    await post.get_by_role("button", name="Hide").click()
 
 
 async def report_post(page, post_title, reason):
@@ -324,9 +410,8 @@ async def report_post(page, post_title, reason):
     Usage Log:
     - Reported spam post with reason "Spam"
     """
-    import re
     post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"report", re.IGNORECASE)).click()
+    await post.get_by_role("button", name="Report").click()
     await page.get_by_role("radio", name=reason).click()
     await page.get_by_role("button", name="Submit").click()
 
@@ -344,9 +429,8 @@ async def edit_post(page, new_content):
     Usage Log:
     - Edited post content successfully
     """
-    import re
-    await page.get_by_role("button", name=re.compile(r"edit", re.IGNORECASE)).click()
-    await page.get_by_role("textbox", name="Text").fill(new_content)
+    await page.get_by_role("button", name="Edit").click()
+    await page.get_by_role("textbox", name="Text", exact=True).fill(new_content)
     await page.get_by_role("button", name="Save").click()
 
 
@@ -362,9 +446,10 @@ async def delete_post(page):
     Usage Log:
     - Deleted test post successfully
     """
-    import re
-    await page.get_by_role("button", name=re.compile(r"delete", re.IGNORECASE)).click()
-    await page.get_by_role("button", name=re.compile(r"confirm|yes", re.IGNORECASE)).click()
+    await page.get_by_role("button", name="Delete").click()
+    await page.get_by_role("button", name="Confirm").or_(
+        page.get_by_role("button", name="Yes")
+    ).first.click()
 
 
 async def reply_to_comment(page, comment_text, reply_text):
@@ -382,7 +467,8 @@ async def reply_to_comment(page, comment_text, reply_text):
     - Replied to comment "Great post!" with "Thanks!"
     """
     import re
-    comment = page.get_by_role("article").filter(has=page.get_by_text(comment_text))
+    # One CSS query for the comment article, filtered by its text
+    comment = page.locator("article").filter(has_text=comment_text).first
     await comment.get_by_role("button", name=re.compile(r"reply", re.IGNORECASE)).click()
     await page.get_by_role("textbox", name="Comment").fill(reply_text)
     await page.get_by_role("button", name="Comment").click()
@@ -399,9 +485,9 @@ async def upvote_comment(page, comment_text):
     Usage Log:
     - Upvoted helpful comment successfully
     """
-    import re
-    comment = page.get_by_role("article").filter(has=page.get_by_text(comment_text))
-    await comment.get_by_role("button", name=re.compile(r"upvote", re.IGNORECASE)).click()
+    # One CSS query for the comment article, filtered by its text
+    comment = page.locator("article").filter(has_text=comment_text).first
+    await comment.get_by_role("button", name="Upvote").click()
 
 
 async def create_link_post(page, subreddit_name, title, url):
@@ -422,8 +508,8 @@ async def create_link_post(page, subreddit_name, title, url):
     await page.goto(f"/r/{subreddit_name}/submit")
     
     await page.get_by_role("tab", name="Link").click()
-    await page.get_by_role("textbox", name="Title").fill(title)
-    await page.get_by_role("textbox", name="URL").fill(url)
+    await page.get_by_role("textbox", name="Title", exact=True).fill(title)
+    await page.get_by_role("textbox", name="URL", exact=True).fill(url)
     await page.get_by_role("button", name="Submit").click()
 
 
@@ -486,8 +572,9 @@ async def search_within_subreddit(page, subreddit_name, query):
     - Uses /f/ format for Postmill
     """
     await page.goto(f"/f/{subreddit_name}")
-    await page.get_by_role("searchbox").fill(query)
-    await page.get_by_role("searchbox").press("Enter")
+    search_box = page.get_by_role("searchbox")
+    await search_box.fill(query)
+    await search_box.press("Enter")
 
 
 async def filter_search_by_subreddit(page):
@@ -561,8 +648,8 @@ async def open_comments_by_link(page, post_title):
     - Works reliably with Postmill structure
     """
     import re
-    
-    post = page.get_by_role("article").filter(has=page.get_by_text(re.compile(re.escape(post_title), re.IGNORECASE))).first
+    title_pat = re.compile(re.escape(post_title), re.IGNORECASE)
+    post = page.get_by_role("article").filter(has=page.get_by_text(title_pat)).first
     await post.get_by_role("link", name=re.compile(r"\d+\s*comments?", re.IGNORECASE)).click()
 
 
@@ -603,35 +690,37 @@ async def navigate_to_forums_list(page):
     await page.goto("/forums")
 
 
-async def edit_user_biography(page, bio_text):
+async def edit_user_biography(page, bio_text, username="MarvelsGrantMan136"):
     """
     Edit the current user's biography/profile description.
     
-    Navigates to profile, then to edit bio page, fills in text and saves.
+    Opens the Postmill edit-biography page directly, falling back to the
+    user menu -> profile -> "Edit biography" click path if that URL 404s.
     
     Args:
         page: The Playwright page object.
         bio_text: New biography text to set.
+        username: Name of the logged-in user whose biography is edited.
     
     Usage Log:
     - Updated user bio successfully
     - Works for changing profile descriptions
     """
     import re
-    
-    # Click user menu to access profile
-    user_button = page.get_by_role("button", name=re.compile(r"MarvelsGrantMan136", re.IGNORECASE))
-    await user_button.click()
-    
-    # Navigate to profile
-    await page.get_by_role("link", name=re.compile(r"Profile", re.IGNORECASE)).click()
-    
-    # Click edit biography link
-    await page.get_by_role("link", name=re.compile(r"Edit biography", re.IGNORECASE)).click()
+    response = await page.goto(f"/user/{username}/edit_biography")
+    if response is None or response.status == 404:
+        # Click user menu to access profile
+        await page.get_by_role("button", name=username).click()
+        
+        # Navigate to profile
+        await page.get_by_role("link", name=re.compile(r"profile", re.IGNORECASE)).click()
+        
+        # Click edit biography link
+        await page.get_by_role("link", name=re.compile(r"edit biography", re.IGNORECASE)).click()
     
     # Fill in the biography field
-    bio_field = page.get_by_role("textbox", name=re.compile(r"Biography", re.IGNORECASE))
+    bio_field = page.get_by_role("textbox", name="Biography", exact=True)
     await bio_field.fill(bio_text)
     
     # Save changes
-    await page.get_by_role("button", name=re.compile(r"Save", re.IGNORECASE)).click()
+    await page.get_by_role("button", name="Save").click()
@@ -4,9 +4,41 @@ Comprehensive Reddit Skills Library for WebArena SkillWeaver
 This library contains reusable skills for automating Reddit interactions.
 Skills cover posting, commenting, searching, voting, user interactions,
 subreddit navigation, and more.
+
+None of the skills look at images, fonts or media; call
+`setup_fast_context(page)` once before running them to skip downloading
+those resources for every page in the page's context.
+
+Call every skill with the same long-lived page (from
+`skillweaver.environment.make_browser`) rather than launching a browser per
+call. For concurrent work use `new_tab(page)` / `run_skills_parallel`, which
+open extra contexts on that same browser.
 """
 
 
+async def setup_fast_context(page):
+    """
+    Stop downloading images, fonts and media in the page's browser context.
+    
+    Applies to `page` and to every page opened later in the same context.
+    Call once before running other skills; none of them need those resources.
+    
+    Args:
+        page: The Playwright page object.
+    
+    Usage Log:
+    - Skipped image/font/media downloads on forum listings with many thumbnails
+    """
+
+    async def block_heavy_resources(route):
+        if route.request.resource_type in ("image", "font", "media"):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.context.route("**/*", block_heavy_resources)
+
+
 # ============================================================================
 # NAVIGATION SKILLS
 # ============================================================================
@@ -21,7 +53,7 @@ async def go_to_homepage(page):
     Usage Log:
     - Basic navigation starting point for many workflows
     """
-    await page.goto("/")
+    await page.goto("/", wait_until="domcontentloaded")
 
 
 async def go_to_subreddit(page, subreddit_name):
@@ -36,7 +68,7 @@ async def go_to_subreddit(page, subreddit_name):
     - Navigate to specific communities for browsing or posting
     - Postmill uses /f/ prefix for forums, not /r/
     """
-    await page.goto(f"/f/{subreddit_name}")
+    await page.goto(f"/f/{subreddit_name}", wait_until="domcontentloaded")
 
 
 async def go_to_user_profile(page, username):
@@ -50,7 +82,7 @@ async def go_to_user_profile(page, username):
     Usage Log:
     - View user posts, comments, and profile information
     """
-    await page.goto(f"/user/{username}")
+    await page.goto(f"/user/{username}", wait_until="domcontentloaded")
 
 
 async def go_to_submit_page(page):
@@ -63,7 +95,7 @@ async def go_to_submit_page(page):
     Usage Log:
     - Starting point for creating new posts
     """
-    await page.goto("/submit")
+    await page.goto("/submit", wait_until="domcontentloaded")
 
 
 async def go_to_forums_list(page):
@@ -77,7 +109,7 @@ async def go_to_forums_list(page):
     - Browse available forums/communities
     - Starting point for discovering new forums
     """
-    await page.goto("/forums")
+    await page.goto("/forums", wait_until="domcontentloaded")
 
 
 async def go_to_search(page):
@@ -90,7 +122,7 @@ async def go_to_search(page):
     Usage Log:
     - Entry point for searching posts and content
     """
-    await page.goto("/search")
+    await page.goto("/search", wait_until="domcontentloaded")
 
 
 # ============================================================================
@@ -115,18 +147,19 @@ async def create_text_post(page, subreddit_name, title, text_content):
     - Title and text fields accept markdown formatting
     """
     import re
-    
-    await page.goto("/submit")
+    await page.goto("/submit", wait_until="domcontentloaded")
     
     # Select subreddit
-    await page.get_by_role("combobox", name=re.compile(r"choose a community", re.IGNORECASE)).fill(subreddit_name)
+    await page.get_by_role("combobox", name="choose a community").fill(subreddit_name)
     await page.get_by_role("option", name=subreddit_name).click()
     
     # Fill title
-    await page.get_by_role("textbox", name=re.compile(r"title", re.IGNORECASE)).fill(title)
+    await page.get_by_role("textbox", name="Title", exact=True).fill(title)
     
-    # Fill text content
-    await page.get_by_role("textbox", name=re.compile(r"text|body", re.IGNORECASE)).fill(text_content)
+    # Fill text content; Postmill labels it "Body", some forms use "Text"
+    await page.get_by_role("textbox", name="Body", exact=True).or_(
+        page.get_by_role("textbox", name="Text", exact=True)
+    ).first.fill(text_content)
     
     # Submit
     await page.get_by_role("button", name=re.compile(r"post|submit", re.IGNORECASE)).click()
@@ -146,21 +179,20 @@ async def create_link_post(page, subreddit_name, title, url):
     - Share external links and articles
     """
     import re
-    
-    await page.goto("/submit")
+    await page.goto("/submit", wait_until="domcontentloaded")
     
     # Select link/URL tab
     await page.get_by_role("tab", name=re.compile(r"link|url", re.IGNORECASE)).click()
     
     # Select subreddit
-    await page.get_by_role("combobox", name=re.compile(r"choose a community", re.IGNORECASE)).fill(subreddit_name)
+    await page.get_by_role("combobox", name="choose a community").fill(subreddit_name)
     await page.get_by_role("option", name=subreddit_name).click()
     
     # Fill title
-    await page.get_by_role("textbox", name=re.compile(r"title", re.IGNORECASE)).fill(title)
+    await page.get_by_role("textbox", name="Title", exact=True).fill(title)
     
     # Fill URL
-    await page.get_by_role("textbox", name=re.compile(r"url|link", re.IGNORECASE)).fill(url)
+    await page.get_by_role("textbox", name="URL", exact=True).fill(url)
     
     # Submit
     await page.get_by_role("button", name=re.compile(r"post|submit", re.IGNORECASE)).click()
@@ -186,12 +218,11 @@ async def add_comment_to_post(page, post_title, comment_text):
     - Works when post is visible on current page
     """
     import re
-    
     # Find and click the post
     await page.get_by_role("link", name=post_title).click()
     
     # Find comment box and add comment
-    await page.get_by_role("textbox", name=re.compile(r"comment", re.IGNORECASE)).fill(comment_text)
+    await page.get_by_role("textbox", name="comment").fill(comment_text)
     await page.get_by_role("button", name=re.compile(r"comment|save", re.IGNORECASE)).click()
 
 
@@ -211,13 +242,12 @@ async def reply_to_comment(page, parent_comment_text, reply_text):
     - Partial text matching helps find comments
     """
     import re
-    
     # Find the comment and click reply
     comment = page.get_by_text(parent_comment_text)
-    await comment.get_by_role("button", name=re.compile(r"reply", re.IGNORECASE)).click()
+    await comment.get_by_role("button", name="reply").click()
     
     # Fill and submit reply
-    await page.get_by_role("textbox", name=re.compile(r"comment", re.IGNORECASE)).fill(reply_text)
+    await page.get_by_role("textbox", name="comment").fill(reply_text)
     await page.get_by_role("button", name=re.compile(r"comment|save", re.IGNORECASE)).click()
 
 
@@ -236,10 +266,8 @@ async def upvote_post(page, post_title):
     Usage Log:
     - Quick upvoting from feed or subreddit view
     """
-    import re
-    
-    post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"upvote", re.IGNORECASE)).click()
+    post = page.locator("article").filter(has_text=post_title).first
+    await post.get_by_role("button", name="upvote").click()
 
 
 async def downvote_post(page, post_title):
@@ -253,10 +281,8 @@ async def downvote_post(page, post_title):
     Usage Log:
     - Express disagreement or mark low-quality content
     """
-    import re
-    
-    post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"downvote", re.IGNORECASE)).click()
+    post = page.locator("article").filter(has_text=post_title).first
+    await post.get_by_role("button", name="downvote").click()
 
 
 async def upvote_comment(page, comment_text):
@@ -270,10 +296,8 @@ async def upvote_comment(page, comment_text):
     Usage Log:
     - Support helpful or insightful comments
     """
-    import re
-    
     comment = page.get_by_text(comment_text)
-    await comment.get_by_role("button", name=re.compile(r"upvote", re.IGNORECASE)).click()
+    await comment.get_by_role("button", name="upvote").click()
 
 
 # ============================================================================
@@ -292,11 +316,10 @@ async def search_posts(page, query):
     - Basic post searching across all forums
     - Uses searchbox in header for quick searches
     """
-    import re
-    
     # Use the search box in the header
-    await page.get_by_role("searchbox", name=re.compile(r"search", re.IGNORECASE)).fill(query)
-    await page.get_by_role("searchbox", name=re.compile(r"search", re.IGNORECASE)).press("Enter")
+    search_box = page.get_by_role("searchbox", name="search")
+    await search_box.fill(query)
+    await search_box.press("Enter")
 
 
 async def search_in_subreddit(page, subreddit_name, query):
@@ -312,11 +335,10 @@ async def search_in_subreddit(page, subreddit_name, query):
     - Find posts within specific communities
     - Updated for Postmill's /f/ URL pattern
     """
-    import re
-    
-    await page.goto(f"/f/{subreddit_name}")
-    await page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE)).fill(query)
-    await page.get_by_role("button", name=re.compile(r"search", re.IGNORECASE)).click()
+    await page.goto(f"/f/{subreddit_name}", wait_until="domcontentloaded")
+    await page.get_by_role("textbox", name="search").fill(query)
+    async with page.expect_navigation(wait_until="domcontentloaded"):
+        await page.get_by_role("button", name="search").click()
 
 
 async def search_posts_by_author(page, username):
@@ -330,9 +352,9 @@ async def search_posts_by_author(page, username):
     Usage Log:
     - Find all posts from a specific user
     """
-    await page.goto("/search")
-    await page.get_by_role("textbox", name="search").fill(f"author:{username}")
-    await page.get_by_role("button", name="search").click()
+    from urllib.parse import urlencode
+    query = urlencode({"q": f"author:{username}"})
+    await page.goto(f"/search?{query}", wait_until="domcontentloaded")
 
 
 async def search_posts_by_flair(page, flair_text):
@@ -346,11 +368,9 @@ async def search_posts_by_flair(page, flair_text):
     Usage Log:
     - Find posts tagged with specific categories
     """
-    import re
-    
-    await page.goto("/search")
-    await page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE)).fill(f"flair:{flair_text}")
-    await page.get_by_role("button", name=re.compile(r"search", re.IGNORECASE)).click()
+    from urllib.parse import urlencode
+    query = urlencode({"q": f"flair:{flair_text}"})
+    await page.goto(f"/search?{query}", wait_until="domcontentloaded")
 
 
 async def search_posts_by_url(page, url):
@@ -364,11 +384,9 @@ async def search_posts_by_url(page, url):
     Usage Log:
     - Find discussions about specific links
     """
-    import re
-    
-    await page.goto("/search")
-    await page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE)).fill(f"url:{url}")
-    await page.get_by_role("button", name=re.compile(r"search", re.IGNORECASE)).click()
+    from urllib.parse import urlencode
+    query = urlencode({"q": f"url:{url}"})
+    await page.goto(f"/search?{query}", wait_until="domcontentloaded")
 
 
 async def search_posts_in_timeframe(page, query, timeframe):
@@ -384,14 +402,12 @@ async def search_posts_in_timeframe(page, query, timeframe):
     - Find recent or historical posts
     """
     import re
-    
-    await page.goto("/search")
-    await page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE)).fill(query)
-    await page.get_by_role("button", name=re.compile(r"search", re.IGNORECASE)).click()
+    from urllib.parse import urlencode
+    await page.goto(f"/search?{urlencode({'q': query})}", wait_until="domcontentloaded")
     
     # Apply time filter
     await page.get_by_role("button", name=re.compile(r"time|filter", re.IGNORECASE)).click()
-    await page.get_by_role("menuitem", name=re.compile(timeframe, re.IGNORECASE)).click()
+    await page.get_by_role("menuitem", name=timeframe).click()
 
 
 # ============================================================================
@@ -409,10 +425,8 @@ async def save_post(page, post_title):
     Usage Log:
     - Bookmark interesting posts
     """
-    import re
-    
-    post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"save", re.IGNORECASE)).click()
+    post = page.locator("article").filter(has_text=post_title).first
+    await post.get_by_role("button", name="save").click()
 
 
 async def hide_post(page, post_title):
@@ -426,10 +440,8 @@ async def hide_post(page, post_title):
     Usage Log:
     - Remove unwanted content from feed
     """
-    import re
-    
-    post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"hide", re.IGNORECASE)).click()
+    post = page.locator("article").filter(has_text=post_title).first
+    await post.get_by_role("button", name="hide").click()
 
 
 async def share_post(page, post_title):
@@ -443,10 +455,8 @@ async def share_post(page, post_title):
     Usage Log:
     - Get shareable link or share to other platforms
     """
-    import re
-    
-    post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"share", re.IGNORECASE)).click()
+    post = page.locator("article").filter(has_text=post_title).first
+    await post.get_by_role("button", name="share").click()
 
 
 async def report_post(page, post_title, reason):
@@ -462,9 +472,8 @@ async def report_post(page, post_title, reason):
     - Flag inappropriate content
     """
     import re
-    
-    post = page.get_by_role("article").filter(has=page.get_by_text(post_title))
-    await post.get_by_role("button", name=re.compile(r"report", re.IGNORECASE)).click()
+    post = page.locator("article").filter(has_text=post_title).first
+    await post.get_by_role("button", name="report").click()
     
     # Select reason
     await page.get_by_role("radio", name=reason).click()
@@ -488,8 +497,7 @@ async def join_subreddit(page, subreddit_name):
     - Uses /f/ URL pattern for Postmill forums
     """
     import re
-    
-    await page.goto(f"/f/{subreddit_name}")
+    await page.goto(f"/f/{subreddit_name}", wait_until="domcontentloaded")
     await page.get_by_role("button", name=re.compile(r"join|subscribe", re.IGNORECASE)).click()
 
 
@@ -506,8 +514,7 @@ async def leave_subreddit(page, subreddit_name):
     - Uses /f/ URL pattern for Postmill forums
     """
     import re
-    
-    await page.goto(f"/f/{subreddit_name}")
+    await page.goto(f"/f/{subreddit_name}", wait_until="domcontentloaded")
     await page.get_by_role("button", name=re.compile(r"leave|unsubscribe|joined", re.IGNORECASE)).click()
 
 
@@ -526,9 +533,19 @@ async def sort_posts_by_hot(page):
     - See currently trending content
     """
     import re
-    
-    await page.get_by_role("button", name=re.compile(r"sort", re.IGNORECASE)).click()
-    await page.get_by_role("menuitem", name=re.compile(r"hot", re.IGNORECASE)).click()
+    from urllib.parse import urlsplit
+    # Postmill puts the sort mode in the listing path (/f/<forum>/<sort>),
+    # so one navigation replaces opening the sort menu and picking an item
+    match = re.match(
+        r"^(/f/[^/]+|/featured|/subscribed|/all)?"
+        r"(?:/(?:hot|new|active|top|controversial|most_commented))?/?$",
+        urlsplit(page.url).path,
+    )
+    if match is not None:
+        await page.goto(f"{match.group(1) or ''}/hot", wait_until="domcontentloaded")
+        return
+    await page.get_by_role("button", name="sort").click()
+    await page.get_by_role("menuitem", name="hot").click()
 
 
 async def sort_posts_by_new(page):
@@ -543,14 +560,23 @@ async def sort_posts_by_new(page):
     - Essential for finding latest content in forums
     """
     import re
-    
-    # Check if already on New sort by looking at current button text
-    sort_button = page.get_by_role("button", name=re.compile(r"sort", re.IGNORECASE))
-    button_text = await sort_button.text_content()
-    
-    if "new" not in button_text.lower():
-        await sort_button.click()
-        await page.get_by_role("menuitem", name=re.compile(r"new", re.IGNORECASE)).click()
+    from urllib.parse import urlsplit
+    # The sort mode is the last segment of a Postmill listing path, so the
+    # URL alone tells whether the page is already sorted by new
+    if urlsplit(page.url).path.rstrip("/").endswith("/new"):
+        return
+    # Postmill puts the sort mode in the listing path (/f/<forum>/<sort>),
+    # so one navigation replaces opening the sort menu and picking an item
+    match = re.match(
+        r"^(/f/[^/]+|/featured|/subscribed|/all)?"
+        r"(?:/(?:hot|new|active|top|controversial|most_commented))?/?$",
+        urlsplit(page.url).path,
+    )
+    if match is not None:
+        await page.goto(f"{match.group(1) or ''}/new", wait_until="domcontentloaded")
+        return
+    await page.get_by_role("button", name="sort").click()
+    await page.get_by_role("menuitem", name="new").click()
 
 
 async def sort_posts_by_top(page):
@@ -564,9 +590,19 @@ async def sort_posts_by_top(page):
     - See highest voted content
     """
     import re
-    
-    await page.get_by_role("button", name=re.compile(r"sort", re.IGNORECASE)).click()
-    await page.get_by_role("menuitem", name=re.compile(r"top", re.IGNORECASE)).click()
+    from urllib.parse import urlsplit
+    # Postmill puts the sort mode in the listing path (/f/<forum>/<sort>),
+    # so one navigation replaces opening the sort menu and picking an item
+    match = re.match(
+        r"^(/f/[^/]+|/featured|/subscribed|/all)?"
+        r"(?:/(?:hot|new|active|top|controversial|most_commented))?/?$",
+        urlsplit(page.url).path,
+    )
+    if match is not None:
+        await page.goto(f"{match.group(1) or ''}/top", wait_until="domcontentloaded")
+        return
+    await page.get_by_role("button", name="sort").click()
+    await page.get_by_role("menuitem", name="top").click()
 
 
 async def filter_top_posts_by_timeframe(page, timeframe):
@@ -580,9 +616,7 @@ async def filter_top_posts_by_timeframe(page, timeframe):
     Usage Log:
     - View top content from specific time periods
     """
-    import re
-    
-    await page.get_by_role("combobox", name=re.compile(r"time", re.IGNORECASE)).select_option(timeframe)
+    await page.get_by_role("combobox", name="time").select_option(timeframe)
 
 
 # ============================================================================
@@ -602,12 +636,10 @@ async def send_private_message(page, username, subject, message):
     Usage Log:
     - Direct communication with other users
     """
-    import re
-    
-    await page.goto(f"/message/compose/?to={username}")
-    await page.get_by_role("textbox", name=re.compile(r"subject", re.IGNORECASE)).fill(subject)
-    await page.get_by_role("textbox", name=re.compile(r"message", re.IGNORECASE)).fill(message)
-    await page.get_by_role("button", name=re.compile(r"send", re.IGNORECASE)).click()
+    await page.goto(f"/message/compose/?to={username}", wait_until="domcontentloaded")
+    await page.get_by_role("textbox", name="Subject", exact=True).fill(subject)
+    await page.get_by_role("textbox", name="Message", exact=True).fill(message)
+    await page.get_by_role("button", name="send").click()
 
 
 async def follow_user(page, username):
@@ -621,13 +653,11 @@ async def follow_user(page, username):
     Usage Log:
     - Stay updated on specific user's content
     """
-    import re
-    
-    await page.goto(f"/user/{username}")
-    await page.get_by_role("button", name=re.compile(r"follow", re.IGNORECASE)).click()
+    await page.goto(f"/user/{username}", wait_until="domcontentloaded")
+    await page.get_by_role("button", name="follow").click()
 
 
-async def edit_user_biography(page, biography_text):
+async def edit_user_biography(page, biography_text, username="MarvelsGrantMan136"):
     """
     Edit the current user's biography.
     
@@ -636,27 +666,27 @@ async def edit_user_biography(page, biography_text):
     Args:
         page: The Playwright page object.
         biography_text: New biography text to set.
+        username: Logged-in username shown on the user dropdown button.
     
     Usage Log:
     - Update user profile information
     - Accessed through user dropdown menu
     """
     import re
-    
     # Click on user profile button (expanded state shows it's a dropdown)
-    await page.get_by_role("button", name=re.compile(r"MarvelsGrantMan136", re.IGNORECASE)).click()
+    await page.get_by_role("button", name=username).click()
     
     # Navigate to user settings or profile edit
     await page.get_by_role("link", name=re.compile(r"user settings|preferences", re.IGNORECASE)).click()
     
     # Find and click edit biography link
-    await page.get_by_role("link", name=re.compile(r"edit biography", re.IGNORECASE)).click()
+    await page.get_by_role("link", name="edit biography").click()
     
     # Fill biography textbox
-    await page.get_by_role("textbox", name=re.compile(r"biography", re.IGNORECASE)).fill(biography_text)
+    await page.get_by_role("textbox", name="Biography", exact=True).fill(biography_text)
     
     # Save changes
-    await page.get_by_role("button", name=re.compile(r"save", re.IGNORECASE)).click()
+    await page.get_by_role("button", name="save").click()
 
 
 async def block_user(page, username):
@@ -671,10 +701,9 @@ async def block_user(page, username):
     - Prevent interactions with specific users
     """
     import re
-    
-    await page.goto(f"/user/{username}")
+    await page.goto(f"/user/{username}", wait_until="domcontentloaded")
     await page.get_by_role("button", name=re.compile(r"more|options", re.IGNORECASE)).click()
-    await page.get_by_role("menuitem", name=re.compile(r"block", re.IGNORECASE)).click()
+    await page.get_by_role("menuitem", name="block").click()
     await page.get_by_role("button", name=re.compile(r"confirm|block", re.IGNORECASE)).click()
 
 
@@ -695,15 +724,14 @@ async def find_and_upvote_post(page, search_query):
     Usage Log:
     - Quick workflow for supporting content
     """
-    import re
-    
-    await page.goto("/search")
-    await page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE)).fill(search_query)
-    await page.get_by_role("button", name=re.compile(r"search", re.IGNORECASE)).click()
+    await page.goto("/search", wait_until="domcontentloaded")
+    await page.get_by_role("textbox", name="search").fill(search_query)
+    async with page.expect_navigation(wait_until="domcontentloaded"):
+        await page.get_by_role("button", name="search").click()
     
     # Upvote first result
     first_post = page.get_by_role("article").first
-    await first_post.get_by_role("button", name=re.compile(r"upvote", re.IGNORECASE)).click()
+    await first_post.get_by_role("button", name="upvote").click()
 
 
 async def create_post_and_comment(page, subreddit_name, title, text_content, comment_text):
@@ -723,19 +751,22 @@ async def create_post_and_comment(page, subreddit_name, title, text_content, com
     - Add clarifying information or sources immediately after posting
     """
     import re
-    
-    await page.goto("/submit")
+    await page.goto("/submit", wait_until="domcontentloaded")
     
     # Create post
-    await page.get_by_role("combobox", name=re.compile(r"choose a community", re.IGNORECASE)).fill(subreddit_name)
+    await page.get_by_role("combobox", name="choose a community").fill(subreddit_name)
     await page.get_by_role("option", name=subreddit_name).click()
-    await page.get_by_role("textbox", name=re.compile(r"title", re.IGNORECASE)).fill(title)
-    await page.get_by_role("textbox", name=re.compile(r"text|body", re.IGNORECASE)).fill(text_content)
-    await page.get_by_role("button", name=re.compile(r"post|submit", re.IGNORECASE)).click()
+    await page.get_by_role("textbox", name="Title", exact=True).fill(title)
+    await page.get_by_role("textbox", name="Body", exact=True).or_(
+        page.get_by_role("textbox", name="Text", exact=True)
+    ).first.fill(text_content)
+    async with page.expect_navigation(wait_until="domcontentloaded"):
+        await page.get_by_role("button", name=re.compile(r"post|submit", re.IGNORECASE)).click()
     
     # Add comment
-    await page.get_by_role("textbox", name=re.compile(r"comment", re.IGNORECASE)).fill(comment_text)
-    await page.get_by_role("button", name=re.compile(r"comment|save", re.IGNORECASE)).click()
+    await page.get_by_role("textbox", name="comment").fill(comment_text)
+    async with page.expect_navigation(wait_until="domcontentloaded"):
+        await page.get_by_role("button", name=re.compile(r"comment|save", re.IGNORECASE)).click()
 
 
 async def navigate_to_forum_from_list(page, forum_name):
@@ -751,16 +782,15 @@ async def navigate_to_forum_from_list(page, forum_name):
     - Useful when exact forum URL is unknown
     - Handles Postmill forum name format (e.g., "Showerthoughts — Showerthoughts")
     """
-    import re
-    
-    await page.goto("/forums")
+    await page.goto("/forums", wait_until="domcontentloaded")
     
     # Try exact forum name first
-    try:
-        await page.get_by_role("link", name=re.compile(forum_name, re.IGNORECASE)).click()
-    except:
+    forum_link = page.get_by_role("link", name=forum_name)
+    if await forum_link.count():
+        await forum_link.first.click()
+    else:
         # If not found, try navigating directly via URL
-        await page.goto(f"/f/{forum_name}")
+        await page.goto(f"/f/{forum_name}", wait_until="domcontentloaded")
 
 
 async def go_to_showerthoughts(page):
@@ -774,7 +804,7 @@ async def go_to_showerthoughts(page):
     - Quick navigation to popular Showerthoughts forum
     - Commonly used in test scenarios
     """
-    await page.goto("/f/Showerthoughts")
+    await page.goto("/f/Showerthoughts", wait_until="domcontentloaded")
 
 
 async def search_forums_list(page, query):
@@ -789,10 +819,10 @@ async def search_forums_list(page, query):
     - Find forums when browsing directory
     - Alternative to direct URL navigation
     """
-    await page.goto("/forums")
+    await page.goto("/forums", wait_until="domcontentloaded")
     
     # Use page search if available
-    await page.get_by_role("searchbox", name=re.compile(r"search", re.IGNORECASE)).fill(query)
+    await page.get_by_role("searchbox", name="search").fill(query)
     await page.keyboard.press("Enter")
 
 
@@ -807,10 +837,7 @@ async def filter_posts_by_featured(page):
     - View curated/featured posts
     - Uses Postmill's filtering system
     """
-    import re
-    
-    await page.get_by_role("button", name=re.compile(r"filter", re.IGNORECASE)).click()
-    await page.get_by_role("menuitem", name=re.compile(r"featured", re.IGNORECASE)).click()
+    await page.goto("/featured", wait_until="domcontentloaded")
 
 
 async def filter_posts_by_subscribed(page):
@@ -823,10 +850,7 @@ async def filter_posts_by_subscribed(page):
     Usage Log:
     - View personalized feed from joined forums
     """
-    import re
-    
-    await page.get_by_role("button", name=re.compile(r"filter", re.IGNORECASE)).click()
-    await page.get_by_role("menuitem", name=re.compile(r"subscribed", re.IGNORECASE)).click()
+    await page.goto("/subscribed", wait_until="domcontentloaded")
 
 
 async def search_join_and_post(page, subreddit_name, post_title, post_text):
@@ -846,18 +870,97 @@ async def search_join_and_post(page, subreddit_name, post_title, post_text):
     - Updated for Postmill's /f/ URL pattern
     """
     import re
-    
     # Navigate to forum and join
-    await page.goto(f"/f/{subreddit_name}")
+    await page.goto(f"/f/{subreddit_name}", wait_until="domcontentloaded")
     await page.get_by_role("button", name=re.compile(r"join|subscribe", re.IGNORECASE)).click()
     
     # Create post
-    await page.goto("/submit")
-    await page.get_by_role("combobox", name=re.compile(r"choose a community", re.IGNORECASE)).fill(subreddit_name)
+    await page.goto("/submit", wait_until="domcontentloaded")
+    await page.get_by_role("combobox", name="choose a community").fill(subreddit_name)
     await page.get_by_role("option", name=subreddit_name).click()
-    await page.get_by_role("textbox", name=re.compile(r"title", re.IGNORECASE)).fill(post_title)
-    await page.get_by_role("textbox", name=re.compile(r"text|body", re.IGNORECASE)).fill(post_text)
-    await page.get_by_role("button", name=re.compile(r"post|submit", re.IGNORECASE)).click()
+    await page.get_by_role("textbox", name="Title", exact=True).fill(post_title)
+    await page.get_by_role("textbox", name="Body", exact=True).or_(
+        page.get_by_role("textbox", name="Text", exact=True)
+    ).first.fill(post_text)
+    async with page.expect_navigation(wait_until="domcontentloaded"):
+        await page.get_by_role("button", name=re.compile(r"post|submit", re.IGNORECASE)).click()
+
+
+async def new_tab(page, storage_state=None):
+    """
+    Open a page in a new browser context that shares `page`'s session.
+    
+    The context reuses the running browser (no new launch), carries the
+    login state of `page`, blocks heavy resources via `setup_fast_context`,
+    and starts on the same site so relative `page.goto` calls work.
+    Close it with `await tab.context.close()`.
+    
+    Args:
+        page: The Playwright page object whose browser and session to reuse.
+        storage_state: Pre-fetched `page.context.storage_state()`, to avoid
+            re-reading it when opening many tabs.
+    
+    Returns:
+        Page: The new page, already on the site's root URL.
+    
+    Usage Log:
+    - Gives each parallel skill call its own context instead of its own browser
+    """
+    from urllib.parse import urlsplit
+    if storage_state is None:
+        storage_state = await page.context.storage_state()
+    origin = urlsplit(page.url)
+    context = await page.context.browser.new_context(storage_state=storage_state)
+    tab = await context.new_page()
+    await setup_fast_context(tab)
+    await tab.goto(f"{origin.scheme}://{origin.netloc}/", wait_until="domcontentloaded")
+    return tab
+
+
+async def run_skills_parallel(page, skill_calls, max_parallel=3):
+    """
+    Run independent skill calls concurrently, each in its own browser context.
+    
+    Every call gets a fresh context from `new_tab`, carrying this page's login
+    state and opened on the same site, so skills run exactly as they would on
+    `page` but without waiting for one another.
+    
+    Args:
+        page: The Playwright page object (source of browser, session and site).
+        skill_calls: Iterable of (skill, args) pairs, e.g.
+            [(find_and_upvote_post, ("python tips",)), (join_subreddit, ("space",))].
+        max_parallel: Maximum number of contexts open at once.
+    
+    Returns:
+        list: Each skill's return value, in the order of `skill_calls`.
+    
+    Usage Log:
+    - Batches of independent composites (search+upvote, join+post) finish in
+      roughly one skill's time per `max_parallel` calls
+    """
+    import asyncio
+    storage_state = await page.context.storage_state()
+    semaphore = asyncio.Semaphore(max_parallel)
+    
+    tabs = []
+    
+    async def run(skill, args):
+        async with semaphore:
+            tab = await new_tab(page, storage_state)
+            tabs.append(tab)
+            result = await skill(tab, *args)
+            await tab.context.close()
+            return result
+    
+    results = await asyncio.gather(
+        *(run(skill, args) for skill, args in skill_calls), return_exceptions=True
+    )
+    # Close the contexts of calls that failed part-way, then surface the failure
+    await asyncio.gather(*(tab.context.close() for tab in tabs if not tab.is_closed()))
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
+    return results
 
 
 # ============================================================================
@@ -877,14 +980,11 @@ async def get_latest_post_author(page, forum_name):
     - Useful for tasks analyzing user activity
     - Updated to handle Postmill's author link structure (direct username links)
     """
-    await page.goto(f"/f/{forum_name}")
-    
-    # Get first article (latest post)
-    first_post = page.get_by_role("article").first
+    await page.goto(f"/f/{forum_name}", wait_until="domcontentloaded")
     
-    # In Postmill, author links are just the username with /user/{username} URLs
-    # Find the link element that points to /user/
-    author_link = first_post.locator('a[href^="/user/"]').first
+    # In Postmill, author links are just the username with /user/{username} URLs;
+    # the first one inside an article belongs to the latest post
+    author_link = page.locator('article a[href^="/user/"]').first
     author_text = await author_link.text_content()
     
     return author_text.strip()
@@ -902,12 +1002,10 @@ async def get_user_comments(page, username):
     - Access user's comment history for analysis
     - Navigate to comments tab on profile
     """
-    import re
-    
-    await page.goto(f"/user/{username}")
+    await page.goto(f"/user/{username}", wait_until="domcontentloaded")
     
     # Click on comments tab/link
-    await page.get_by_role("link", name=re.compile(r"comments", re.IGNORECASE)).click()
+    await page.get_by_role("link", name="comments").click()
 
 
 async def get_comment_vote_counts(page, comment_element):
@@ -924,25 +1022,24 @@ async def get_comment_vote_counts(page, comment_element):
     - Handles various vote display formats in Postmill
     """
     import re
+    # The comment may have been re-rendered away; only read it if it is there
+    if not await comment_element.count():
+        return (0, 0)
     
-    # Try to get vote count text from various possible locations
-    try:
-        # Look for vote/score information in the comment metadata
-        vote_text = await comment_element.inner_text()
-        
-        # Extract all numbers from the text
-        numbers = re.findall(r'(\d+)\s*point|(\d+)\s*vote|score[:\s]+(\d+)', vote_text.lower())
-        
-        # Flatten and filter out empty matches
-        numbers = [int(n) for group in numbers for n in group if n]
-        
-        if len(numbers) >= 2:
-            return (int(numbers[0]), int(numbers[1]))
-        elif len(numbers) == 1:
-            # If only one number, assume it's net score
-            return (int(numbers[0]), 0)
-    except:
-        pass
+    # Look for vote/score information in the comment metadata
+    vote_text = await comment_element.inner_text(timeout=1000)
+    
+    # Extract all numbers from the text; exactly one group matches per hit
+    numbers = [
+        int(m.group(1) or m.group(2))
+        for m in re.finditer(r"(\d+)\s*(?:point|vote)|score[:\s]+(\d+)", vote_text.lower())
+    ]
+    
+    if len(numbers) >= 2:
+        return (numbers[0], numbers[1])
+    elif len(numbers) == 1:
+        # If only one number, assume it's net score
+        return (numbers[0], 0)
     
     return (0, 0)
 
@@ -958,7 +1055,7 @@ async def count_all_comments(page):
     - Count total comments visible
     - Useful for pagination and analysis tasks
     """
-    comments = page.get_by_role("article").filter(has=page.get_by_role("button", name=re.compile(r"reply", re.IGNORECASE)))
+    comments = page.locator('article:has(button:has-text("reply"))')
     return await comments.count()
 
 
@@ -977,16 +1074,13 @@ async def navigate_to_user_comments_from_profile(page, username):
     - Combines navigation and tab selection
     - Handles Postmill's user profile structure
     """
-    import re
+    await page.goto(f"/user/{username}", wait_until="domcontentloaded")
     
-    await page.goto(f"/user/{username}")
-    
-    # Look for comments or submissions link/tab
-    try:
-        await page.get_by_role("link", name=re.compile(r"comments", re.IGNORECASE)).click()
-    except:
-        # If no comments link, user might not have comments or page structure is different
-        pass
+    # Look for comments or submissions link/tab; if there is none, the user
+    # might not have comments or the page structure is different
+    comments_link = page.get_by_role("link", name="comments")
+    if await comments_link.count():
+        await comments_link.first.click()
 
 
 async def count_downvoted_comments(page, username):
@@ -1004,33 +1098,25 @@ async def count_downvoted_comments(page, username):
     - Identify controversial comments
     """
     import re
-    
-    await page.goto(f"/user/{username}")
+    await page.goto(f"/user/{username}", wait_until="domcontentloaded")
     
     # Try to navigate to comments section
-    try:
-        await page.get_by_role("link", name=re.compile(r"comments", re.IGNORECASE)).click()
-    except:
-        pass
+    comments_link = page.get_by_role("link", name="comments")
+    if await comments_link.count():
+        await comments_link.first.click()
     
-    # Get all comment articles
-    comments = await page.get_by_role("article").all()
+    # Get the text of every comment article in one round trip
+    texts = await page.eval_on_selector_all("article", "els => els.map(e => e.innerText)")
     
     downvoted_count = 0
     
-    for comment in comments:
-        try:
-            # Get the text content of the comment article
-            text = await comment.inner_text()
-            
-            # Look for vote patterns like "X points" or upvote/downvote counts
-            # In Postmill, negative scores indicate more downvotes
-            score_match = re.search(r'(-?\d+)\s*point', text)
-            if score_match:
-                score = int(score_match.group(1))
-                if score < 0:
-                    downvoted_count += 1
-        except:
-            continue
+    for text in texts:
+        # Look for vote patterns like "X points" or upvote/downvote counts
+        # In Postmill, negative scores indicate more downvotes
+        score_match = re.search(r"(-?\d+)\s*point", text)
+        if score_match:
+            score = int(score_match.group(1))
+            if score < 0:
+                downvoted_count += 1
     
     return downvoted_count
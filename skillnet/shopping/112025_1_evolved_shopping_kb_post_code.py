@@ -21,23 +21,18 @@ async def search_products(page, query):
     - Searched "laptop" - returned product listing page with results
     - Searched "shoes" - found multiple categories of footwear
     - Fixed: Button is disabled until text is entered, now we fill first then wait
+    - Submits with Enter, which does not need the button enabled, so no wait
     """
-    import re
-    
-    await page.goto("/")
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
     
-    # Find and fill search box (handle combobox or textbox)
-    search_input = page.get_by_role("combobox", name=re.compile(r"search", re.IGNORECASE))
-    if await search_input.count() == 0:
-        search_input = page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE))
-    
-    # Fill the query - this enables the search button
+    # Fill and submit with Enter; no need to wait for the search button
+    search_input = page.locator(
+        'input#search, input[name="q"], '
+        '[role="combobox"][aria-label*="search" i], input[aria-label*="search" i]'
+    ).first
     await search_input.fill(query)
-    
-    # Wait briefly for button to become enabled after filling
-    await page.wait_for_timeout(100)
-    
-    # Submit search: Press Enter is more reliable than clicking button
     await search_input.press("Enter")
 
 
@@ -58,23 +53,17 @@ async def search_products_by_category(page, query, category_name):
     - Searched "bag" in "Fashion" - showed only fashion bags
     """
     import re
-    
-    await page.goto("/")
-    
-    # Perform search (supports combobox or textbox; button or Enter)
-    search_input = page.get_by_role("combobox", name=re.compile(r"search", re.IGNORECASE))
-    if await search_input.count() > 0:
-        await search_input.fill(query)
-    else:
-        search_input = page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE))
-        await search_input.fill(query)
-    try:
-        await page.get_by_role("button", name=re.compile(r"search|go|find", re.IGNORECASE)).click()
-    except Exception:
-        try:
-            await search_input.press("Enter")
-        except Exception:
-            await page.keyboard.press("Enter")
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
+    
+    # Perform search
+    search_input = page.locator(
+        'input#search, input[name="q"], '
+        '[role="combobox"][aria-label*="search" i], input[aria-label*="search" i]'
+    ).first
+    await search_input.fill(query)
+    await search_input.press("Enter")
     
     # Filter by category
     await page.get_by_role("combobox", name=re.compile(r"category", re.IGNORECASE)).select_option(category_name)
@@ -95,7 +84,9 @@ async def navigate_to_category(page, category_name):
     - Navigated to "Electronics" - showed electronics category page
     - Navigated to "Books" - displayed book listings
     """
-    await page.goto("/")
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
     
     # Click category link
     await page.get_by_role("link", name=category_name).click()
@@ -116,27 +107,20 @@ async def view_product_details(page, product_name):
     - Viewed "Wireless Mouse" - opened detail page with specs
     - Viewed "USB Cable" - showed product images and description
     """
-    import re
-    
-    await page.goto("/")
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
     
-    # Search for product (combobox/textbox + button/Enter)
-    search_input = page.get_by_role("combobox", name=re.compile(r"search", re.IGNORECASE))
-    if await search_input.count() > 0:
-        await search_input.fill(product_name)
-    else:
-        search_input = page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE))
-        await search_input.fill(product_name)
-    try:
-        await page.get_by_role("button", name=re.compile(r"search|go|find", re.IGNORECASE)).click()
-    except Exception:
-        try:
-            await search_input.press("Enter")
-        except Exception:
-            await page.keyboard.press("Enter")
+    # Search for product
+    search_input = page.locator(
+        'input#search, input[name="q"], '
+        '[role="combobox"][aria-label*="search" i], input[aria-label*="search" i]'
+    ).first
+    await search_input.fill(product_name)
+    await search_input.press("Enter")
     
     # Click first product result
-    await page.get_by_role("link", name=re.compile(product_name, re.IGNORECASE)).first.click()
+    await page.get_by_role("link", name=product_name).first.click()
 
 
 async def add_to_cart_from_search(page, product_name):
@@ -154,30 +138,26 @@ async def add_to_cart_from_search(page, product_name):
     - Added "Wireless Keyboard" - successfully added, cart updated
     - Added "HDMI Cable" - added but stayed on product page
     """
-    import re
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
     
-    await page.goto("/")
-    
-    # Search for product (combobox/textbox + button/Enter)
-    search_input = page.get_by_role("combobox", name=re.compile(r"search", re.IGNORECASE))
-    if await search_input.count() > 0:
-        await search_input.fill(product_name)
-    else:
-        search_input = page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE))
-        await search_input.fill(product_name)
-    try:
-        await page.get_by_role("button", name=re.compile(r"search|go|find", re.IGNORECASE)).click()
-    except Exception:
-        try:
-            await search_input.press("Enter")
-        except Exception:
-            await page.keyboard.press("Enter")
+    # Search for product
+    search_input = page.locator(
+        'input#search, input[name="q"], '
+        '[role="combobox"][aria-label*="search" i], input[aria-label*="search" i]'
+    ).first
+    await search_input.fill(product_name)
+    await search_input.press("Enter")
     
     # Click first result
-    await page.get_by_role("link", name=re.compile(product_name, re.IGNORECASE)).first.click()
+    await page.get_by_role("link", name=product_name).first.click()
     
     # Add to cart
-    await page.get_by_role("button", name=re.compile(r"add to (cart|basket)", re.IGNORECASE)).click()
+    await page.locator(
+        '#product-addtocart-button, '
+        'button:has-text("Add to Cart"), button:has-text("Add to Basket")'
+    ).first.click()
 
 
 async def add_to_cart_from_details(page):
@@ -194,7 +174,6 @@ async def add_to_cart_from_details(page):
     - Button text varies: "Add to Cart", "Add to Basket"
     """
     import re
-    
     await page.get_by_role("button", name=re.compile(r"add to (cart|basket)", re.IGNORECASE)).click()
 
 
@@ -211,12 +190,9 @@ async def view_cart(page):
     - Navigated to cart - showed all items with quantities
     - Empty cart showed "Your cart is empty" message
     """
-    import re
-    
-    await page.goto("/")
-    
-    # Click cart icon/link
-    await page.get_by_role("link", name=re.compile(r"cart|basket", re.IGNORECASE)).click()
+    from urllib.parse import urlsplit
+    if "/checkout/cart" not in urlsplit(page.url).path:
+        await page.goto("/checkout/cart/", wait_until="domcontentloaded")
 
 
 async def update_cart_quantity(page, product_name, quantity):
@@ -235,12 +211,12 @@ async def update_cart_quantity(page, product_name, quantity):
     - Set quantity to 0 to remove item - worked
     """
     import re
-    
-    await page.goto("/")
-    await page.get_by_role("link", name=re.compile(r"cart", re.IGNORECASE)).click()
+    from urllib.parse import urlsplit
+    if "/checkout/cart" not in urlsplit(page.url).path:
+        await page.goto("/checkout/cart/", wait_until="domcontentloaded")
     
     # Find the product row and update quantity
-    product_row = page.get_by_role("row").filter(has=page.get_by_text(product_name))
+    product_row = page.locator("tr").filter(has=page.get_by_role("cell", name=product_name)).first
     quantity_input = product_row.get_by_role("spinbutton", name=re.compile(r"quantity", re.IGNORECASE))
     
     await quantity_input.fill(str(quantity))
@@ -266,12 +242,12 @@ async def remove_from_cart(page, product_name):
     - Removing last item showed empty cart message
     """
     import re
-    
-    await page.goto("/")
-    await page.get_by_role("link", name=re.compile(r"cart", re.IGNORECASE)).click()
+    from urllib.parse import urlsplit
+    if "/checkout/cart" not in urlsplit(page.url).path:
+        await page.goto("/checkout/cart/", wait_until="domcontentloaded")
     
     # Find product and click remove button
-    product_row = page.get_by_role("row").filter(has=page.get_by_text(product_name))
+    product_row = page.locator("tr").filter(has=page.get_by_role("cell", name=product_name)).first
     await product_row.get_by_role("button", name=re.compile(r"remove|delete", re.IGNORECASE)).click()
 
 
@@ -288,13 +264,12 @@ async def proceed_to_checkout(page):
     - Proceeded to checkout - navigated to shipping info page
     - Required items in cart - error if cart empty
     """
-    import re
-    
-    await page.goto("/")
-    await page.get_by_role("link", name=re.compile(r"cart", re.IGNORECASE)).click()
+    from urllib.parse import urlsplit
+    if "/checkout/cart" not in urlsplit(page.url).path:
+        await page.goto("/checkout/cart/", wait_until="domcontentloaded")
     
     # Click checkout button
-    await page.get_by_role("button", name=re.compile(r"checkout|proceed", re.IGNORECASE)).click()
+    await page.locator('button[data-role="proceed-to-checkout"], button:has-text("checkout")').first.click()
 
 
 async def filter_by_price_range(page, min_price=None, max_price=None):
@@ -314,7 +289,6 @@ async def filter_by_price_range(page, min_price=None, max_price=None):
     - Only max price filtered correctly without min
     """
     import re
-    
     if min_price is not None:
         min_input = page.get_by_role("spinbutton", name=re.compile(r"min.*price", re.IGNORECASE))
         await min_input.fill(str(min_price))
@@ -343,7 +317,6 @@ async def sort_products(page, sort_option):
     - Sorted by "Customer Rating" - top rated shown first
     """
     import re
-    
     # Find sort dropdown
     sort_dropdown = page.get_by_role("combobox", name=re.compile(r"sort", re.IGNORECASE))
     await sort_dropdown.select_option(sort_option)
@@ -364,7 +337,6 @@ async def filter_by_brand(page, brand_name):
     - Multiple brand filters can be combined
     """
     import re
-    
     # Try checkbox first
     brand_checkbox = page.get_by_role("checkbox", name=brand_name)
     if await brand_checkbox.count() > 0:
@@ -390,26 +362,20 @@ async def add_to_wishlist(page, product_name):
     - Required login if not authenticated
     """
     import re
-    
-    await page.goto("/")
-    
-    # Search for product (combobox/textbox + button/Enter)
-    search_input = page.get_by_role("combobox", name=re.compile(r"search", re.IGNORECASE))
-    if await search_input.count() > 0:
-        await search_input.fill(product_name)
-    else:
-        search_input = page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE))
-        await search_input.fill(product_name)
-    try:
-        await page.get_by_role("button", name=re.compile(r"search|go|find", re.IGNORECASE)).click()
-    except Exception:
-        try:
-            await search_input.press("Enter")
-        except Exception:
-            await page.keyboard.press("Enter")
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
+    
+    # Search for product
+    search_input = page.locator(
+        'input#search, input[name="q"], '
+        '[role="combobox"][aria-label*="search" i], input[aria-label*="search" i]'
+    ).first
+    await search_input.fill(product_name)
+    await search_input.press("Enter")
     
     # Click first result
-    await page.get_by_role("link", name=re.compile(product_name, re.IGNORECASE)).first.click()
+    await page.get_by_role("link", name=product_name).first.click()
     
     # Click wishlist button
     await page.get_by_role("button", name=re.compile(r"wishlist|favorite|save", re.IGNORECASE)).click()
@@ -429,8 +395,9 @@ async def view_wishlist(page):
     - Required login first
     """
     import re
-    
-    await page.goto("/")
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
     
     # Click wishlist link
     await page.get_by_role("link", name=re.compile(r"wishlist|favorites", re.IGNORECASE)).click()
@@ -451,44 +418,96 @@ async def login(page, username, password):
     - Logged in with valid credentials - redirected to account page
     - Invalid password showed error message
     """
+    import asyncio
     import re
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
     
-    await page.goto("/")
+    # Probe the header links together instead of one round trip each
+    sign_out = page.get_by_role("link", name=re.compile(r"sign out", re.IGNORECASE))
+    acct = page.get_by_role("link", name=re.compile(r"my account|account|profile", re.IGNORECASE))
+    entry = page.get_by_role("link", name=re.compile(r"(my account|account|profile|login|sign in)", re.IGNORECASE))
+    sign_out_count, acct_count, entry_count = await asyncio.gather(
+        sign_out.count(), acct.count(), entry.count()
+    )
     
     # If already logged in (Sign Out visible), go to account and return
-    sign_out = page.get_by_role("link", name=re.compile(r"sign out", re.IGNORECASE))
-    if await sign_out.count() > 0:
-        acct = page.get_by_role("link", name=re.compile(r"my account|account|profile", re.IGNORECASE))
-        if await acct.count() > 0:
+    if sign_out_count > 0:
+        if acct_count > 0:
             await acct.click()
         return
     
     # Navigate to login form via account link or direct login page
-    entry = page.get_by_role("link", name=re.compile(r"(my account|account|profile|login|sign in)", re.IGNORECASE))
-    if await entry.count() > 0:
+    if entry_count > 0:
         await entry.click()
     else:
-        await page.goto("/customer/account/login/")
+        await page.goto("/customer/account/login/", wait_until="domcontentloaded")
+    
+    # Enter credentials (labels or role textboxes, whichever resolves)
+    email_input = page.get_by_label(re.compile(r"(email|username)", re.IGNORECASE)).or_(
+        page.get_by_role("textbox", name=re.compile(r"(email|username)", re.IGNORECASE))
+    ).first
+    password_input = page.get_by_label(re.compile(r"password", re.IGNORECASE)).or_(
+        page.get_by_role("textbox", name=re.compile(r"password", re.IGNORECASE))
+    ).first
+    await email_input.fill(username)
+    await password_input.fill(password)
+    
+    # Submit login (button or Enter fallback); the form is rendered by now,
+    # so count() answers without waiting out an action timeout
+    submit_button = page.get_by_role("button", name=re.compile(r"(log in|login|sign in|submit)", re.IGNORECASE)).first
+    if await submit_button.count() > 0:
+        await submit_button.click()
+    else:
+        await password_input.press("Enter")
+
+
+async def login_or_restore(page, username, password, state_path=None):
+    """
+    Log in by restoring saved session cookies, running `login` only if needed.
     
-    # Enter credentials (prefer labels; fallback to role textbox)
-    try:
-        await page.get_by_label(re.compile(r"(email|username)", re.IGNORECASE)).fill(username)
-    except Exception:
-        await page.get_by_role("textbox", name=re.compile(r"(email|username)", re.IGNORECASE)).fill(username)
+    Loads the cookies saved by a previous call for the same user and site
+    into the current context, then checks the account page for "Sign Out"
+    and the username. If the session is missing, has expired or belongs to
+    another account, clears the cookies, performs the full `login` flow and
+    saves the new cookies.
     
-    try:
-        await page.get_by_label(re.compile(r"password", re.IGNORECASE)).fill(password)
-    except Exception:
-        await page.get_by_role("textbox", name=re.compile(r"password", re.IGNORECASE)).fill(password)
+    Args:
+        page: The Playwright page object.
+        username: Account username or email.
+        password: Account password.
+        state_path: File the session storage state is saved to / read from
+            (defaults to a file in the temp directory keyed by site and username).
     
-    # Submit login (button or Enter fallback)
-    try:
-        await page.get_by_role("button", name=re.compile(r"(log in|login|sign in|submit)", re.IGNORECASE)).click()
-    except Exception:
-        try:
-            await page.get_by_label(re.compile(r"password", re.IGNORECASE)).press("Enter")
-        except Exception:
-            await page.keyboard.press("Enter")
+    Usage Log:
+    - Restored saved cookies instead of re-submitting the login form
+    - Falls back to the form when the saved session has expired
+    - Ignores a saved session that is logged in as a different account
+    """
+    import hashlib
+    import json
+    import os
+    import re
+    import tempfile
+    from urllib.parse import urlsplit
+    if state_path is None:
+        origin = urlsplit(page.url)
+        key = hashlib.sha256(f"{origin.scheme}://{origin.netloc}|{username}".encode()).hexdigest()[:16]
+        state_path = os.path.join(tempfile.gettempdir(), f"onestopshop_state_{key}.json")
+    if os.path.exists(state_path):
+        with open(state_path) as f:
+            await page.context.add_cookies(json.load(f).get("cookies", []))
+        await page.goto("/customer/account/", wait_until="domcontentloaded")
+        signed_in = await page.get_by_role("link", name=re.compile(r"sign out", re.IGNORECASE)).count() > 0
+        if signed_in and await page.get_by_text(username).count() > 0:
+            return
+        # Drop the stale or foreign session so `login` does not mistake it for ours
+        await page.context.clear_cookies()
+    
+    await login(page, username, password)
+    await page.context.storage_state(path=state_path)
+    os.chmod(state_path, 0o600)
 
 
 async def view_order_history(page):
@@ -506,8 +525,9 @@ async def view_order_history(page):
     - Fixed: Now uses direct "My Orders" link visible in main navigation
     """
     import re
-    
-    await page.goto("/")
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
     
     # Try direct "My Orders" link first (visible in header when logged in)
     my_orders = page.get_by_role("link", name=re.compile(r"my orders", re.IGNORECASE))
@@ -520,15 +540,21 @@ async def view_order_history(page):
     await page.get_by_role("link", name=re.compile(r"orders|order history", re.IGNORECASE)).click()
 
 
-async def get_product_price(page, product_name):
+async def get_product_price(page, product_name, use_api_fastpath=False):
     """
     Get the price of a product from search results.
     
     Searches for product and returns the price of the first result.
+    Leaves the page on the search results. With `use_api_fastpath`, the
+    search results HTML is fetched directly instead (no rendering, and the
+    page is not navigated when a price is found); the browser search is
+    used as a fallback if that request fails or shows no price.
     
     Args:
         page: The Playwright page object.
         product_name: Name of the product to check.
+        use_api_fastpath: Read the price from a plain HTTP fetch first
+            (default False).
     
     Returns:
         Price string (e.g., "$29.99")
@@ -538,26 +564,31 @@ async def get_product_price(page, product_name):
     - Price includes currency symbol
     """
     import re
+    from urllib.parse import urlencode, urlsplit
+    if use_api_fastpath:
+        # GET the results page with the page's cookies, without rendering it
+        origin = urlsplit(page.url)
+        response = await page.request.get(
+            f"{origin.scheme}://{origin.netloc}/catalogsearch/result/?{urlencode({'q': product_name})}"
+        )
+        html = await response.text() if response.ok else None
+        price_match = re.search(r'<span[^>]*class="price"[^>]*>([^<]+)</span>', html) if html else None
+        if price_match:
+            return price_match.group(1).strip()
+    
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
+    
+    # Search for product
+    search_input = page.locator(
+        'input#search, input[name="q"], '
+        '[role="combobox"][aria-label*="search" i], input[aria-label*="search" i]'
+    ).first
+    await search_input.fill(product_name)
+    await search_input.press("Enter")
     
-    await page.goto("/")
-    
-    # Search for product (combobox/textbox + button/Enter)
-    search_input = page.get_by_role("combobox", name=re.compile(r"search", re.IGNORECASE))
-    if await search_input.count() > 0:
-        await search_input.fill(product_name)
-    else:
-        search_input = page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE))
-        await search_input.fill(product_name)
-    try:
-        await page.get_by_role("button", name=re.compile(r"search|go|find", re.IGNORECASE)).click()
-    except Exception:
-        try:
-            await search_input.press("Enter")
-        except Exception:
-            await page.keyboard.press("Enter")
-    
-    # Get price from first result (more robust text matcher)
-    price_element = page.get_by_text(re.compile(r"\$\s?\d+(?:\.\d{2})?")).first
+    # Get price from first result
+    price_element = page.locator("span.price").first
     return await price_element.inner_text()
 
 
@@ -576,9 +607,9 @@ async def apply_coupon_code(page, coupon_code):
     - Invalid codes showed error message
     """
     import re
-    
-    await page.goto("/")
-    await page.get_by_role("link", name=re.compile(r"cart", re.IGNORECASE)).click()
+    from urllib.parse import urlsplit
+    if "/checkout/cart" not in urlsplit(page.url).path:
+        await page.goto("/checkout/cart/", wait_until="domcontentloaded")
     
     # Find coupon input
     coupon_input = page.get_by_role("textbox", name=re.compile(r"coupon|promo", re.IGNORECASE))
@@ -603,24 +634,18 @@ async def view_product_reviews(page, product_name):
     - Some products have "See reviews" button
     """
     import re
-    
-    await page.goto("/")
-    
-    # Search and open product (combobox/textbox + button/Enter)
-    search_input = page.get_by_role("combobox", name=re.compile(r"search", re.IGNORECASE))
-    if await search_input.count() > 0:
-        await search_input.fill(product_name)
-    else:
-        search_input = page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE))
-        await search_input.fill(product_name)
-    try:
-        await page.get_by_role("button", name=re.compile(r"search|go|find", re.IGNORECASE)).click()
-    except Exception:
-        try:
-            await search_input.press("Enter")
-        except Exception:
-            await page.keyboard.press("Enter")
-    await page.get_by_role("link", name=re.compile(product_name, re.IGNORECASE)).first.click()
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
+    
+    # Search and open product
+    search_input = page.locator(
+        'input#search, input[name="q"], '
+        '[role="combobox"][aria-label*="search" i], input[aria-label*="search" i]'
+    ).first
+    await search_input.fill(product_name)
+    await search_input.press("Enter")
+    await page.get_by_role("link", name=product_name).first.click()
     
     # Click reviews tab/button
     reviews_button = page.get_by_role("button", name=re.compile(r"reviews?", re.IGNORECASE))
@@ -628,15 +653,21 @@ async def view_product_reviews(page, product_name):
         await reviews_button.click()
 
 
-async def get_order_total_for_month(page, month_year):
+async def get_order_total_for_month(page, month_year, use_api_fastpath=False):
     """
     Calculate total spending for a specific month from order history.
     
     Navigates to order history and sums up completed orders for the given month.
+    With `use_api_fastpath`, the order history HTML is fetched directly
+    instead (no rendering, and the page is not navigated when rows are
+    found); the browser path is used as a fallback if that request fails
+    or returns no order rows.
     
     Args:
         page: The Playwright page object.
         month_year: Month and year string (e.g., "March 2023", "3/2023", "2023-03").
+        use_api_fastpath: Read the order rows from a plain HTTP fetch first
+            (default False).
     
     Returns:
         Float total amount spent in that month.
@@ -646,60 +677,68 @@ async def get_order_total_for_month(page, month_year):
     - Handles various date formats
     """
     import re
-    from datetime import datetime
-    
-    await page.goto("/")
-    
-    # Navigate to order history
-    my_orders = page.get_by_role("link", name=re.compile(r"my orders", re.IGNORECASE))
-    if await my_orders.count() > 0:
-        await my_orders.click()
-    else:
-        await page.get_by_role("link", name=re.compile(r"account|profile", re.IGNORECASE)).click()
-        await page.get_by_role("link", name=re.compile(r"orders", re.IGNORECASE)).click()
-    
+    from html import unescape
+    from urllib.parse import urlsplit
     # Parse target month/year
-    month_patterns = {
-        'january': '1', 'february': '2', 'march': '3', 'april': '4',
-        'may': '5', 'june': '6', 'july': '7', 'august': '8',
-        'september': '9', 'october': '10', 'november': '11', 'december': '12'
-    }
-    
     target_month = None
     target_year = None
     
     # Try to extract month and year
-    for month_name, month_num in month_patterns.items():
-        if month_name in month_year.lower():
-            target_month = month_num
-            break
+    month_numbers = {
+        'january': '1', 'february': '2', 'march': '3', 'april': '4',
+        'may': '5', 'june': '6', 'july': '7', 'august': '8',
+        'september': '9', 'october': '10', 'november': '11', 'december': '12'
+    }
+    month_match = re.search("|".join(month_numbers), month_year, re.IGNORECASE)
+    if month_match:
+        target_month = month_numbers[month_match.group().lower()]
     
-    year_match = re.search(r'20\d{2}', month_year)
+    year_match = re.search(r"20\d{2}", month_year)
     if year_match:
         target_year = year_match.group()
     
-    # Get all order rows
-    table = page.get_by_role("table", name=re.compile(r"orders?", re.IGNORECASE))
-    rows = await table.get_by_role("row").all()
+    row_texts = None
+    if use_api_fastpath:
+        # GET the order history with the page's cookies, without rendering it,
+        # and join the text of each <tr> the way inner_text would
+        origin = urlsplit(page.url)
+        response = await page.request.get(f"{origin.scheme}://{origin.netloc}/sales/order/history/")
+        if response.ok:
+            row_texts = [
+                " ".join(text.strip() for text in re.split(r"<[^>]+>", unescape(row)) if text.strip())
+                for row in re.findall(r"<tr[^>]*>(.*?)</tr>", await response.text(), re.IGNORECASE | re.DOTALL)
+            ] or None
+    
+    if row_texts is None:
+        if urlsplit(page.url).path not in ("", "/"):
+            await page.goto("/", wait_until="domcontentloaded")
+        
+        # Navigate to order history
+        my_orders = page.get_by_role("link", name=re.compile(r"my orders", re.IGNORECASE))
+        if await my_orders.count() > 0:
+            await my_orders.click()
+        else:
+            await page.get_by_role("link", name=re.compile(r"account|profile", re.IGNORECASE)).click()
+            await page.get_by_role("link", name=re.compile(r"orders", re.IGNORECASE)).click()
+        
+        # Get all order rows
+        table = page.get_by_role("table", name=re.compile(r"orders?", re.IGNORECASE))
+        row_texts = await table.get_by_role("row").all_inner_texts()
     
+    # Sum matching orders, skipping the header row
     total = 0.0
-    for row in rows[1:]:  # Skip header row
-        text = await row.inner_text()
-        
-        # Check if this order is from target month/year
-        date_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{2})', text)
-        if date_match:
-            order_month = date_match.group(1)
-            order_year = '20' + date_match.group(3)
-            
-            # Check if matches target month/year
-            if (not target_month or order_month == target_month) and \
-               (not target_year or order_year == target_year):
-                # Extract price (format: $XXX.XX)
-                price_match = re.search(r'\$[\d,]+\.\d{2}', text)
-                if price_match:
-                    price_str = price_match.group().replace('$', '').replace(',', '')
-                    total += float(price_str)
+    for text in row_texts[1:]:
+        date_match = re.search(r"(\d{1,2})/(\d{1,2})/(\d{2})", text)
+        if not date_match:
+            continue
+        if target_month and date_match.group(1) != target_month:
+            continue
+        if target_year and '20' + date_match.group(3) != target_year:
+            continue
+        # Extract price (format: $XXX.XX)
+        price_match = re.search(r"\$[\d,]+\.\d{2}", text)
+        if price_match:
+            total += float(price_match.group().replace('$', '').replace(',', ''))
     
     return total
 
@@ -717,9 +756,10 @@ async def filter_orders_by_category(page, category_name):
     - Useful for tracking spending by department
     """
     import re
-    
+    from urllib.parse import urlsplit
     # Navigate to order history first
-    await page.goto("/")
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
     my_orders = page.get_by_role("link", name=re.compile(r"my orders", re.IGNORECASE))
     if await my_orders.count() > 0:
         await my_orders.click()
@@ -745,15 +785,12 @@ async def search_within_results(page, query):
     - New skill for iterative search refinement
     - Useful for finding specific items within broad categories
     """
-    import re
-    
-    # Find search box on current page and search again
-    search_input = page.get_by_role("combobox", name=re.compile(r"search", re.IGNORECASE))
-    if await search_input.count() == 0:
-        search_input = page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE))
-    
+    # Search again from the search box on the current page
+    search_input = page.locator(
+        'input#search, input[name="q"], '
+        '[role="combobox"][aria-label*="search" i], input[aria-label*="search" i]'
+    ).first
     await search_input.fill(query)
-    await page.wait_for_timeout(100)
     await search_input.press("Enter")
 
 
@@ -772,32 +809,42 @@ async def compare_products(page, product_name_1, product_name_2):
     - Compared two laptops - showed spec comparison table
     - Not all categories support comparison
     """
+    import asyncio
     import re
-    
-    import re
-    
-    await page.goto("/")
-    
-    # Helper function to search (reuse pattern)
-    async def do_search(query):
-        search_input = page.get_by_role("combobox", name=re.compile(r"search", re.IGNORECASE))
-        if await search_input.count() == 0:
-            search_input = page.get_by_role("textbox", name=re.compile(r"search", re.IGNORECASE))
-        await search_input.fill(query)
-        await page.wait_for_timeout(100)
+    from urllib.parse import urlsplit
+    if urlsplit(page.url).path not in ("", "/"):
+        await page.goto("/", wait_until="domcontentloaded")
+    origin = urlsplit(page.url)
+
+    # The compare list lives in the server-side session, so a second
+    # context sharing this one's cookies can add the other product.
+    context2 = await page.context.browser.new_context(
+        storage_state=await page.context.storage_state()
+    )
+    page2 = await context2.new_page()
+    await page2.goto(
+        f"{origin.scheme}://{origin.netloc}/", wait_until="domcontentloaded"
+    )
+    
+    # Search for a product and tick the first compare checkbox
+    async def search_and_check_compare(p, product_name):
+        search_input = p.locator(
+            'input#search, input[name="q"], '
+            '[role="combobox"][aria-label*="search" i], input[aria-label*="search" i]'
+        ).first
+        await search_input.fill(product_name)
         await search_input.press("Enter")
-    
-    # Search for first product
-    await do_search(product_name_1)
-    
-    # Add to compare
-    await page.get_by_role("checkbox", name=re.compile(r"compare", re.IGNORECASE)).first.check()
-    
-    # Search for second product
-    await do_search(product_name_2)
-    
-    # Add to compare
-    await page.get_by_role("checkbox", name=re.compile(r"compare", re.IGNORECASE)).first.check()
-    
+        await p.get_by_role("checkbox", name=re.compile(r"compare", re.IGNORECASE)).first.check()
+    
+    results = await asyncio.gather(
+        search_and_check_compare(page, product_name_1),
+        search_and_check_compare(page2, product_name_2),
+        return_exceptions=True,
+    )
+    await context2.close()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
     # View comparison
-    await page.get_by_role("link", name=re.compile(r"compare", re.IGNORECASE)).click()
+    await page.goto("/catalog/product_compare/", wait_until="domcontentloaded")
@@ -199,7 +199,7 @@ def codegen_trajectory_from_folder(folder: str, weak=False):
     return (states, actions)
 
 
-def _create_codegen_prompt(
+async def _create_codegen_prompt(
     lm: LM,
     states: list[State],
     actions: list[dict],
@@ -242,7 +242,7 @@ def _create_codegen_prompt(
     # Build user content - include screenshot only if model supports vision
     user_content = [{"type": "text", "text": user_text_prompt}]
     if lm.supports_vision:
-        user_content.append(lm.image_url_content_piece(states[-1].screenshot))
+        user_content.append(await lm.image_url_content_piece(states[-1].screenshot))
     
     return [
         {
@@ -271,7 +271,7 @@ async def codegen_generate(
     previous_attempt_code: str | None = None
     max_retries = 5
     for retry_idx in range(max_retries):
-        prompt = _create_codegen_prompt(
+        prompt = await _create_codegen_prompt(
             lm,
             states,
             actions,
@@ -582,6 +582,7 @@ def llm_fuzzy_match(pred: str, reference: str, question: str) -> float:
             temperature=0,
             max_tokens=768,
             top_p=1.0,
+            cache=False,
         )
     ).lower()
     if "partially correct" in response or "incorrect" in response:
@@ -615,6 +616,7 @@ def llm_ua_match(pred: str, reference: str, question: str) -> float:
             temperature=0,
             max_tokens=768,
             top_p=1.0,
+            cache=False,
         )
     ).lower()
     if "different" in response:
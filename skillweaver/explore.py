@@ -50,7 +50,7 @@ async def _generate_test_case_arguments(lm: LM, state: State, function: Function
         }
     ]
     if lm.supports_vision:
-        user_content.append(lm.image_url_content_piece(state.screenshot))
+        user_content.append(await lm.image_url_content_piece(state.screenshot))
     
     return await lm(
         [
@@ -119,7 +119,7 @@ async def _choose_explore_task(
         }
     ]
     if lm.supports_vision:
-        user_content.append(lm.image_url_content_piece(state.screenshot))
+        user_content.append(await lm.image_url_content_piece(state.screenshot))
     
     response = await lm(
         [
@@ -1,3 +1,5 @@
+import asyncio
+
 import PIL.Image
 
 from skillweaver.util import J
@@ -15,7 +17,7 @@ async def check_success_simple(
         }
     ]
     if lm.supports_vision:
-        user_content.append(lm.image_url_content_piece(final_screenshot))
+        user_content.append(await lm.image_url_content_piece(final_screenshot))
     
     return await lm(
         [
@@ -25,4 +27,77 @@ async def check_success_simple(
             }
         ],
         json_schema=J.struct(step_by_step_reasoning=J.string(), success=J.boolean()),
+        cache=False,
     )
+
+
+# Rough per-prompt budget of trajectory text (~8k tokens at ~4 chars/token)
+_BATCH_TEXT_CHARS = 32000
+_MAX_BATCH_SIZE = 8
+
+
+async def check_success_simple_batch(
+    lm: LM,
+    tasks: list[str],
+    trajectories_stringified: list[str],
+    final_screenshots: list[PIL.Image.Image],
+):
+    """
+    Like `check_success_simple`, for several attempts at once.
+
+    Attempts are packed into numbered sections, a few per prompt, so the
+    shared instructions are sent once per group rather than once per attempt.
+    Groups are judged concurrently; a group whose reply does not have one
+    verdict per attempt is re-checked one attempt at a time.
+    """
+    if not tasks:
+        return []
+
+    average_chars = sum(map(len, trajectories_stringified)) / len(tasks)
+    batch_size = max(1, min(_MAX_BATCH_SIZE, int(_BATCH_TEXT_CHARS // max(1, average_chars))))
+    attempts = list(zip(tasks, trajectories_stringified, final_screenshots))
+
+    async def check_group(group):
+        if len(group) == 1:
+            return [await check_success_simple(lm, *group[0])]
+
+        user_content = [
+            {
+                "type": "text",
+                "text": f"Please observe the following {len(group)} action logs of people using a computer. Each was trying to do the task stated in its section. Given each log and the screenshot of their screen at the end of their attempt, please conclude for each whether they were successful. Reply with one result per attempt, in order.",
+            }
+        ]
+        for i, (task, trajectory_stringified, final_screenshot) in enumerate(group, 1):
+            user_content.append(
+                {
+                    "type": "text",
+                    "text": f"Attempt {i}. Task: {task}\n\nTrajectory:\n{trajectory_stringified}",
+                }
+            )
+            if lm.supports_vision:
+                user_content.append(await lm.image_url_content_piece(final_screenshot))
+
+        response = await lm(
+            [
+                {
+                    "role": "user",
+                    "content": user_content,
+                }
+            ],
+            json_schema=J.struct(
+                results=J.list_of(
+                    J.struct(step_by_step_reasoning=J.string(), success=J.boolean())
+                )
+            ),
+            cache=False,
+        )
+        results = response["results"]
+        if len(results) != len(group):
+            return await asyncio.gather(
+                *(check_success_simple(lm, *attempt) for attempt in group)
+            )
+        return results
+
+    groups = [attempts[i : i + batch_size] for i in range(0, len(attempts), batch_size)]
+    grouped_results = await asyncio.gather(*(check_group(group) for group in groups))
+    return [result for results in grouped_results for result in results]
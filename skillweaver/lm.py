@@ -1,23 +1,40 @@
+from __future__ import annotations
+
 import asyncio
-import json
+import collections
+import contextlib
+import functools
+import hashlib
+import importlib.util
 import os
+import random
+import re
+import sqlite3
+import sys
+import threading
 import time
-from typing import Any, TypeVar
+import weakref
+from typing import TYPE_CHECKING, Any, AsyncIterator, TypeVar
 
 import aioconsole
-import anthropic
 import dotenv
-import openai
-import PIL.Image
-from openai.types.chat import (
-    ChatCompletion,
-    ChatCompletionContentPartImageParam,
-    ChatCompletionMessageParam,
-    ChatCompletionToolParam,
-)
+import httpx
+import orjson
 
-from skillweaver.util.image_to_base64 import image_to_base64, image_to_data_url
-from skillweaver.util.perfmon import monitor
+# The provider SDKs are slow to import, so each is only imported once a
+# client for it is created; most runs only ever talk to one provider.
+if TYPE_CHECKING:
+    import anthropic
+    import openai
+    import PIL.Image
+    from openai.types.chat import (
+        ChatCompletion,
+        ChatCompletionContentPartImageParam,
+        ChatCompletionMessageParam,
+        ChatCompletionToolParam,
+    )
+
+from skillweaver.util.perfmon import Stopwatch, monitor
 
 dotenv.load_dotenv()
 
@@ -27,6 +44,130 @@ NoArgs = object()
 ResponseFormatT = TypeVar("ResponseFormatT")
 
 
+# Retries for replies that arrived but could not be used (bad JSON, missing
+# tool call); API-level retries are left to the SDK clients.
+_REPLY_TRIES = 3
+_SDK_MAX_RETRIES = 5
+
+# Model names that accept image inputs; o1-mini and o3-mini are text-only
+_VISION_RE = re.compile(
+    r"vision|gpt-4o|gpt-4-turbo|gpt-4\.1|claude-3|claude-sonnet-4|claude-opus"
+    r"|gemini|(?<![a-z0-9])o[13](?![0-9])(?!-mini)",
+    re.I,
+)
+
+
+# Optional process-wide cap on LM requests in flight across all LM
+# instances. Each LM's own semaphore bounds its callers; this bounds what
+# actually reaches the API when several LMs or workers share one account.
+_GLOBAL_REQUEST_CAP = int(os.getenv("SKILLWEAVER_LM_GLOBAL_CAP", "0"))
+_global_request_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _global_request_slot():
+    if _GLOBAL_REQUEST_CAP <= 0:
+        return contextlib.nullcontext()
+    loop = asyncio.get_running_loop()
+    semaphore = _global_request_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _global_request_semaphores[loop] = asyncio.Semaphore(
+            _GLOBAL_REQUEST_CAP
+        )
+    return semaphore
+
+
+def _next_backoff(previous: float, base: float = 4, cap: float = 30) -> float:
+    # Decorrelated jitter: concurrent calls that failed together spread out
+    # instead of retrying in lockstep
+    return min(cap, random.uniform(base, previous * 3))
+
+
+def _is_response_model(json_schema) -> bool:
+    # json_schema is either a J-style schema dict or a Pydantic model class
+    return isinstance(json_schema, type)
+
+
+def _openai_response_format(json_mode=False, json_schema=None) -> dict:
+    if json_mode:
+        return {"type": "json_object"}
+    elif json_schema:
+        return {
+            "type": "json_schema",
+            "json_schema": json_schema,
+        }
+    else:
+        return {"type": "text"}
+
+
+def _normalize_for_prefix_cache(messages, tools):
+    """
+    Put system messages first and tools in name order, so requests that share
+    static instructions also share a byte-identical prompt prefix. The order
+    of the conversation turns themselves is kept.
+    """
+    messages = [m for m in messages if m["role"] == "system"] + [
+        m for m in messages if m["role"] != "system"
+    ]
+    tools = sorted(tools, key=lambda t: t.get("function", t).get("name", ""))
+    return messages, tools
+
+
+def _prompt_cache_key(key: str, messages) -> str:
+    prefix = _message_text(messages[:1]).encode()
+    return f"{key}:{hashlib.blake2b(prefix, digest_size=8).hexdigest()}"
+
+
+def _add_prompt_cache_key(client, messages, key: str, args: dict):
+    # A stable prompt_cache_key routes requests sharing a prompt prefix to
+    # the same server, so OpenAI's prefix cache hits more often. Unless the
+    # caller passes one, requests are grouped by call key and leading
+    # message. Only the OpenAI API takes it; it is sent as an extra body
+    # field so older SDK versions pass it through.
+    prompt_cache_key = args.pop("prompt_cache_key", None) or _prompt_cache_key(key, messages)
+    if client.base_url.host == "api.openai.com":
+        args["extra_body"] = {
+            **args.get("extra_body", {}),
+            "prompt_cache_key": prompt_cache_key,
+        }
+
+
+async def completion_openai_stream(
+    client: openai.AsyncAzureOpenAI | openai.AsyncOpenAI,
+    model: str,
+    messages: list[ChatCompletionMessageParam],
+    args: dict = NoArgs,  # type: ignore
+    key="general",
+) -> AsyncIterator[str]:
+    """Yield the text of a plain-text completion as it is generated."""
+    args = {} if args is NoArgs else {**args}
+    messages, _ = _normalize_for_prefix_cache(messages, [])
+    _add_prompt_cache_key(client, messages, key, args)
+
+    stopwatch = Stopwatch()
+    usage = None
+    async with _global_request_slot():
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=messages,  # type: ignore
+            stream=True,
+            stream_options={"include_usage": True},
+            **args,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if chunk.usage is not None:
+                usage = chunk.usage
+
+    monitor.log_elapsed("lm/" + key, stopwatch.stop())
+    if usage is not None:
+        monitor.log_token_usage(
+            key, "openai:" + model, usage.prompt_tokens, usage.completion_tokens
+        )
+
+
 async def completion_openai(
     client: openai.AsyncAzureOpenAI | openai.AsyncOpenAI,
     model: str,
@@ -37,45 +178,57 @@ async def completion_openai(
     args: dict = NoArgs,  # type: ignore
     key="general",
 ) -> Any:
+    import openai
+
     if args is NoArgs:
         args = {}
     else:
         args = {**args}
 
-    tries = 5
-    backoff = 4
+    messages, tools = _normalize_for_prefix_cache(messages, tools)
+    _add_prompt_cache_key(client, messages, key, args)
+
+    # Transport errors, rate limits and 5xx are retried by the SDK client
+    # (see _create_client); this loop only re-asks after unusable replies.
+    tries = _REPLY_TRIES
+    backoff = 4.0
+    # Pydantic response models go through the SDK's parse(), which builds
+    # the strict schema and validates the reply into the model
+    parse = _is_response_model(json_schema)
+    if parse and len(tools) > 0:
+        raise ValueError("A response model cannot be combined with tools.")
+
+    # Built once, so every retry sends a byte-identical request
+    call_kwargs = {
+        "model": model,
+        "messages": messages,
+        "response_format": (
+            json_schema if parse else _openai_response_format(json_mode, json_schema)
+        ),
+        **(
+            {
+                "tools": tools,
+                "tool_choice": "required",
+                "parallel_tool_calls": False,
+            }
+            if len(tools) > 0
+            else {}
+        ),
+        **args,
+    }
     for i in range(tries):
         try:
-            start_time = time.time()
-
-            if json_mode:
-                response_format = {"type": "json_object"}
-            elif json_schema:
-                response_format = {
-                    "type": "json_schema",
-                    "json_schema": json_schema,
-                }
-            else:
-                response_format = {"type": "text"}
-
-            response: ChatCompletion = await client.chat.completions.create(
-                model=model,
-                messages=messages,  # type: ignore
-                response_format=response_format,  # type: ignore
-                **(
-                    {
-                        "tools": tools,
-                        "tool_choice": "required",
-                        "parallel_tool_calls": False,
-                    }
-                    if len(tools) > 0
-                    else {}
-                ),
-                **args,
-            )
+            stopwatch = Stopwatch()
 
-            end_time = time.time()
-            monitor.log_timing_event("lm/" + key, start_time, end_time)
+            async with _global_request_slot():
+                if parse:
+                    response = await client.beta.chat.completions.parse(**call_kwargs)  # type: ignore
+                else:
+                    response: ChatCompletion = await client.chat.completions.create(
+                        **call_kwargs  # type: ignore
+                    )
+
+            monitor.log_elapsed("lm/" + key, stopwatch.stop())
             assert response.usage
             msg = response.choices[0].message
             cmpl_tokens = response.usage.completion_tokens  # type: ignore
@@ -96,8 +249,8 @@ async def completion_openai(
                 ), f"Unexpected tool name: {msg.tool_calls[0].function.name}"
 
                 try:
-                    arguments = json.loads(msg.tool_calls[0].function.arguments)
-                except json.JSONDecodeError:
+                    arguments = orjson.loads(msg.tool_calls[0].function.arguments)
+                except orjson.JSONDecodeError:
                     print("JSONDecodeError. Function call arguments:")
                     print(msg.tool_calls[0].function.arguments)
 
@@ -113,10 +266,15 @@ async def completion_openai(
 
             assert msg.content is not None
 
-            if json_mode or json_schema is not None:
-                return json.loads(msg.content)
+            if parse:
+                assert msg.parsed is not None  # type: ignore
+                return msg.parsed  # type: ignore
+            elif json_mode or json_schema is not None:
+                return orjson.loads(msg.content)
             else:
                 return msg.content
+        except openai.APIError:
+            raise
         except Exception as e:
             if "JSON" in str(type(e)).upper():
                 await aioconsole.aprint("JSON error:")
@@ -125,13 +283,138 @@ async def completion_openai(
 
             if i < tries - 1:
                 await aioconsole.aprint(f"Error: {e}. Retrying...")
+                backoff = _next_backoff(backoff)
                 await asyncio.sleep(backoff)
-                backoff = min(30, backoff * 2)
             else:
                 await aioconsole.aprint("Reached maximum number of tries. Raising.")
                 raise
 
 
+@functools.lru_cache(maxsize=64)
+def _schema_instruction(schema_json: bytes) -> str:
+    # Callers rebuild the same few schemas for every request; key on the
+    # compact serialization so the indented prompt text is built once each.
+    schema_def = orjson.loads(schema_json)
+    return f"\n\nYou must respond with valid JSON matching this schema:\n{orjson.dumps(schema_def, option=orjson.OPT_INDENT_2).decode()}\n\nRespond ONLY with the JSON object, no other text."
+
+
+def _anthropic_call_args(
+    model: str,
+    messages: list[ChatCompletionMessageParam],
+    json_schema=None,
+    args: dict = {},
+) -> dict:
+    # Convert OpenAI-style messages to Anthropic format
+    system_message = None
+    anthropic_messages = []
+
+    for msg in messages:
+        if msg["role"] == "system":
+            system_message = msg["content"]
+        else:
+            anthropic_messages.append({
+                "role": msg["role"],
+                "content": msg["content"],
+            })
+
+    # Handle structured output for Anthropic
+    # Anthropic requires max_tokens - set default if not provided
+    max_tokens = 32768
+
+    call_args = {
+        "model": model,
+        "messages": anthropic_messages,
+        "max_tokens": max_tokens,
+        **{k: v for k, v in args.items() if k not in ("max_tokens", "prompt_cache_key")},
+    }
+
+    if system_message:
+        call_args["system"] = system_message
+
+    # Add structured output support via prompt engineering for JSON
+    if json_schema is not None:
+        # Add JSON schema instruction to system message
+        schema_def = (
+            json_schema.model_json_schema()
+            if _is_response_model(json_schema)
+            else json_schema["schema"]
+        )
+        json_instruction = _schema_instruction(orjson.dumps(schema_def))
+        if system_message:
+            call_args["system"] = system_message + json_instruction
+        else:
+            call_args["system"] = json_instruction.strip()
+
+    # Mark the static system prompt, and in multi-turn calls the conversation
+    # up to the last assistant turn, as cacheable prefixes. Prefixes shorter
+    # than Anthropic's minimum are simply not cached.
+    if isinstance(call_args.get("system"), str):
+        call_args["system"] = [_cached_text_block(call_args["system"])]
+    for i in range(len(anthropic_messages) - 1, -1, -1):
+        if anthropic_messages[i]["role"] == "assistant":
+            anthropic_messages[i] = {
+                "role": "assistant",
+                "content": _with_cache_breakpoint(anthropic_messages[i]["content"]),
+            }
+            break
+
+    return call_args
+
+
+def _cached_text_block(text: str) -> dict:
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def _with_cache_breakpoint(content):
+    if isinstance(content, str):
+        return [_cached_text_block(content)]
+    if not content:
+        return content
+    return [*content[:-1], {**content[-1], "cache_control": {"type": "ephemeral"}}]
+
+
+async def completion_anthropic_stream(
+    client: anthropic.AsyncAnthropic,
+    model: str,
+    messages: list[ChatCompletionMessageParam],
+    args: dict = NoArgs,  # type: ignore
+    key="general",
+) -> AsyncIterator[str]:
+    """Yield the text of a plain-text completion as it is generated."""
+    args = {} if args is NoArgs else args
+
+    stopwatch = Stopwatch()
+    call_args = {
+        "timeout": 600.0,
+        **_anthropic_call_args(model, messages, None, args),
+    }
+    async with _global_request_slot():
+        async with client.messages.stream(**call_args) as stream:
+            async for text in stream.text_stream:
+                yield text
+            response = await stream.get_final_message()
+
+    monitor.log_elapsed("lm/" + key, stopwatch.stop())
+    monitor.log_token_usage(
+        key,
+        "anthropic:" + model,
+        response.usage.input_tokens,
+        response.usage.output_tokens,
+    )
+
+
+def _parse_anthropic_json(content: str) -> Any:
+    # Try to extract JSON from markdown code blocks if present
+    fence = "```json" if "```json" in content else "```"
+    start = content.find(fence)
+    if start != -1:
+        start += len(fence)
+        end = content.find("```", start)
+        content = content[start : end if end != -1 else None].strip()
+
+    return orjson.loads(content)
+
+
 async def completion_anthropic(
     client: anthropic.AsyncAnthropic,
     model: str,
@@ -142,59 +425,33 @@ async def completion_anthropic(
     args: dict = NoArgs,  # type: ignore
     key="general",
 ) -> Any:
+    import anthropic
+
     if args is NoArgs:
         args = {}
     else:
         args = {**args}
 
-    tries = 5
-    backoff = 4
+    # Transport errors, rate limits and 5xx are retried by the SDK client
+    # (see _create_client); this loop only re-asks after unusable replies.
+    tries = _REPLY_TRIES
+    backoff = 4.0
     for i in range(tries):
         try:
-            start_time = time.time()
+            stopwatch = Stopwatch()
 
-            # Convert OpenAI-style messages to Anthropic format
-            system_message = None
-            anthropic_messages = []
-            
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_message = msg["content"]
-                else:
-                    anthropic_messages.append({
-                        "role": msg["role"],
-                        "content": msg["content"],
-                    })
-
-            # Handle structured output for Anthropic
-            # Anthropic requires max_tokens - set default if not provided
-            max_tokens = 32768
-            
             call_args = {
-                "model": model,
-                "messages": anthropic_messages,
-                "max_tokens": max_tokens,
                 "timeout": 600.0,  # 10 minutes timeout for long requests
-                **{k: v for k, v in args.items() if k != "max_tokens"},
+                **_anthropic_call_args(model, messages, json_schema, args),
             }
-            
-            if system_message:
-                call_args["system"] = system_message
-
-            # Add structured output support via prompt engineering for JSON
-            if json_schema is not None:
-                schema_def = json_schema["schema"]
-                # Add JSON schema instruction to system message
-                json_instruction = f"\n\nYou must respond with valid JSON matching this schema:\n{json.dumps(schema_def, indent=2)}\n\nRespond ONLY with the JSON object, no other text."
-                if system_message:
-                    call_args["system"] = system_message + json_instruction
-                else:
-                    call_args["system"] = json_instruction.strip()
 
-            response = await client.messages.create(**call_args)
+            # Streamed so long reasoning replies keep the connection active
+            # instead of sitting on one idle request until the reply is done
+            async with _global_request_slot():
+                async with client.messages.stream(**call_args) as stream:
+                    response = await stream.get_final_message()
 
-            end_time = time.time()
-            monitor.log_timing_event("lm/" + key, start_time, end_time)
+            monitor.log_elapsed("lm/" + key, stopwatch.stop())
             
             # Extract token usage
             input_tokens = response.usage.input_tokens
@@ -205,27 +462,25 @@ async def completion_anthropic(
             content = response.content[0].text
 
             # Parse JSON if needed
-            if json_mode or json_schema is not None:
-                # Try to extract JSON from markdown code blocks if present
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                
-                return json.loads(content)
+            if _is_response_model(json_schema):
+                return json_schema.model_validate(_parse_anthropic_json(content))
+            elif json_mode or json_schema is not None:
+                return _parse_anthropic_json(content)
             else:
                 return content
                 
+        except anthropic.APIError:
+            raise
         except Exception as e:
-            if "JSON" in str(type(e)).upper() or isinstance(e, json.JSONDecodeError):
+            if "JSON" in str(type(e)).upper() or isinstance(e, orjson.JSONDecodeError):
                 await aioconsole.aprint("JSON error:")
                 await aioconsole.aprint("Content:", content if 'content' in locals() else "N/A")
                 await aioconsole.aprint(e)
 
             if i < tries - 1:
                 await aioconsole.aprint(f"Error: {e}. Retrying...")
+                backoff = _next_backoff(backoff)
                 await asyncio.sleep(backoff)
-                backoff = min(30, backoff * 2)
             else:
                 await aioconsole.aprint("Reached maximum number of tries. Raising.")
                 raise
@@ -261,25 +516,274 @@ def create_tool_description(tool: ChatCompletionToolParam):
     return string
 
 
+# One pooled HTTP client per event loop, shared by every LM created on that
+# loop. Pooled connections are bound to the loop that opened them, so LMs
+# created outside a running loop (e.g. before an asyncio.run) keep the SDK's
+# own client instead.
+_shared_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+# SDK clients built on each loop's pooled HTTP client, keyed by model name,
+# so LMs for the same model share one client.
+_shared_sdk_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_http_client() -> httpx.AsyncClient | None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    client = _shared_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            # HTTP/2 multiplexes concurrent requests over one connection
+            # per host; it needs the optional h2 package.
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+            timeout=httpx.Timeout(600.0, connect=10.0),
+        )
+        _shared_http_clients[loop] = client
+        _shared_sdk_clients.pop(loop, None)
+    return client
+
+
+class _ResponseCache:
+    """
+    Exact-match store of parsed LM replies, kept in SQLite so repeated
+    deterministic calls are answered across runs without an API round trip.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._db = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB)"
+            )
+        return self._db
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT value FROM responses WHERE key = ?", (key,))
+                .fetchone()
+            )
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                (key, orjson.dumps(value)),
+            )
+
+
+class _SemanticCache:
+    """
+    Replies stored next to the embedding of the request that produced them,
+    so a near-identical later request (cosine similarity above a threshold)
+    can reuse the reply. Entries are grouped by scope, which callers derive
+    from everything except the embedded message text, and persisted in SQLite.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        # scope -> (unit-normalized embedding matrix, replies)
+        self._entries: dict[str, tuple[Any, list]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._db = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS semantic_responses (scope TEXT, embedding BLOB, value BLOB)"
+            )
+        return self._db
+
+    def _load(self, scope: str):
+        import numpy as np
+
+        if scope not in self._entries:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT embedding, value FROM semantic_responses WHERE scope = ?",
+                    (scope,),
+                )
+                .fetchall()
+            )
+            vectors = [np.frombuffer(embedding, dtype=np.float32) for embedding, _ in rows]
+            self._entries[scope] = (
+                np.stack(vectors) if vectors else None,
+                [orjson.loads(value) for _, value in rows],
+            )
+        return self._entries[scope]
+
+    def get(self, scope: str, embedding, threshold: float) -> Any:
+        with self._lock:
+            vectors, values = self._load(scope)
+            if vectors is None:
+                return None
+            similarities = vectors @ embedding
+            best = int(similarities.argmax())
+            return values[best] if similarities[best] >= threshold else None
+
+    def set(self, scope: str, embedding, value: Any):
+        import numpy as np
+
+        with self._lock:
+            vectors, values = self._load(scope)
+            self._connect().execute(
+                "INSERT INTO semantic_responses (scope, embedding, value) VALUES (?, ?, ?)",
+                (scope, embedding.tobytes(), orjson.dumps(value)),
+            )
+            vectors = embedding[None] if vectors is None else np.vstack([vectors, embedding])
+            self._entries[scope] = (vectors, values + [value])
+
+
+def _text_parts(messages) -> list[str]:
+    parts = []
+    for msg in messages:
+        content = msg.get("content")
+        if isinstance(content, str):
+            parts.append(content)
+        elif isinstance(content, list):
+            parts.extend(p["text"] for p in content if p.get("type") == "text")
+    return parts
+
+
+def _message_text(messages) -> str:
+    # Text parts only; screenshots would swamp the embedding input
+    return "\n\n".join(_text_parts(messages))
+
+
+def _non_text_parts(messages) -> list:
+    # Screenshots and other parts left out of the embedding, by message
+    return [
+        [p for p in msg["content"] if p.get("type") != "text"]
+        if isinstance(msg.get("content"), list)
+        else []
+        for msg in messages
+    ]
+
+
+# The on-disk response cache is opt-in: pass `cache=True` to LM.__call__, or
+# set SKILLWEAVER_LM_CACHE (to the database path) to use it by default.
+_response_cache_by_default = bool(os.getenv("SKILLWEAVER_LM_CACHE"))
+_response_cache_path = os.path.expanduser(
+    os.getenv("SKILLWEAVER_LM_CACHE") or "~/.cache/skillweaver/lm_responses.sqlite"
+)
+_response_cache = _ResponseCache(_response_cache_path)
+_semantic_cache = _SemanticCache(_response_cache_path)
+
+
+def _request_hash(parts: list) -> str | None:
+    try:
+        payload = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+    return hashlib.blake2b(payload, digest_size=32).hexdigest()
+
+
+def _response_cache_key(model: str, messages, json_mode, json_schema, tools, args) -> str | None:
+    # Only replies to deterministic requests are worth replaying; sampled
+    # ones are meant to differ between calls.
+    if args.get("temperature") != 0:
+        return None
+    return _request_hash([model, messages, json_mode, json_schema, tools, args])
+
+
+# How screenshots are sent at each detail level: (format, longest side,
+# JPEG quality). "low" trades fidelity for ~5-10x fewer upload bytes.
+_IMAGE_ENCODINGS = {
+    "high": ("png", None, None),
+    "low": ("jpeg", 1024, 80),
+}
+
+
+def _cached_image_base64(image: PIL.Image.Image, detail: str) -> str | None:
+    return getattr(image, "_skillweaver_base64", {}).get(detail)
+
+
+def _image_base64(image: PIL.Image.Image, detail: str = "high") -> str:
+    # Encoding a full screenshot is the costly part of building a request,
+    # and the same screenshot is often sent to several LM calls. Images are
+    # unhashable, so encodings are kept on the image itself; screenshots are
+    # never modified in place after capture.
+    encoded = _cached_image_base64(image, detail)
+    if encoded is None:
+        from skillweaver.util.image_to_base64 import image_to_base64
+
+        format, max_side, quality = _IMAGE_ENCODINGS[detail]
+        encoded = image_to_base64(
+            image, format=format, max_side=max_side, quality=quality
+        )
+        if not hasattr(image, "_skillweaver_base64"):
+            image._skillweaver_base64 = {}  # type: ignore
+        image._skillweaver_base64[detail] = encoded  # type: ignore
+    return encoded
+
+
 def _get_client(model_name: str):
     """
-    Get the appropriate client based on model name and environment variables.
+    Get the client for a model, reusing the one already built for it on
+    the running event loop.
+    """
+    http_client = _shared_http_client()
+    if http_client is None:
+        return _create_client(model_name, None)
+
+    clients = _shared_sdk_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(model_name)
+    if client is None:
+        client = clients[model_name] = _create_client(model_name, http_client)
+    return client
+
+
+def _create_client(model_name: str, http_client: httpx.AsyncClient | None):
+    """
+    Build the appropriate client based on model name and environment variables.
     
     Supports four modes:
     1. Anthropic models (claude-*)
     2. LOCAL_MODEL_API_BASE: For locally hosted models (e.g., vllm)
     3. AZURE_OPENAI: For Azure-hosted OpenAI models
     4. Default: Regular OpenAI API
+
+    `http_client` is the running loop's pooled HTTP client, or None to let
+    the SDK create its own.
     """
-    
     # Check if it's an Anthropic model
     if model_name.lower().startswith("claude"):
+        import anthropic
+
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError(
                 "ANTHROPIC_API_KEY environment variable must be set for Claude models"
             )
-        return anthropic.AsyncAnthropic(api_key=api_key)
+        return anthropic.AsyncAnthropic(
+            api_key=api_key, http_client=http_client, max_retries=_SDK_MAX_RETRIES
+        )
+
+    import openai
 
     # Check for locally hosted model first
     local_api_base = os.getenv("LOCAL_MODEL_API_BASE")
@@ -288,6 +792,8 @@ def _get_client(model_name: str):
         return openai.AsyncOpenAI(
             base_url=local_api_base,
             api_key="not-needed",  
+            http_client=http_client,
+            max_retries=_SDK_MAX_RETRIES,
         )
     
     # Check for Azure OpenAI
@@ -307,10 +813,113 @@ def _get_client(model_name: str):
             azure_endpoint=endpoint,
             api_key=api_key,
             api_version=api_version,
+            http_client=http_client,
+            max_retries=_SDK_MAX_RETRIES,
         )
     else:
         # Let OpenAI configure the API key from environment
-        return openai.AsyncOpenAI()
+        return openai.AsyncOpenAI(http_client=http_client, max_retries=_SDK_MAX_RETRIES)
+
+
+class _RateLimiter:
+    """Token bucket holding up to `capacity` units, refilled over `period` seconds."""
+
+    def __init__(self, capacity: float, period: float = 60.0):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._level = capacity
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1):
+        # A request larger than the whole bucket waits for a full bucket
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._level = min(
+                    self.capacity, self._level + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._level >= amount:
+                    self._level -= amount
+                    return
+                await asyncio.sleep((amount - self._level) / self.rate)
+
+
+# Prompt size for rate limiting and the context-window guard. Text is counted
+# with tiktoken for OpenAI models and as ~4 characters per token otherwise;
+# images get a flat cost (a high-detail screenshot is on the order of 1k).
+_CHARS_PER_TOKEN = 4
+_TOKENS_PER_IMAGE = 1000
+
+# Context windows by model-name prefix, longest prefix first
+_CONTEXT_WINDOWS = [
+    ("gpt-4o-mini", 128_000),
+    ("gpt-4o", 128_000),
+    ("gpt-4.1", 1_047_576),
+    ("gpt-4-turbo", 128_000),
+    # 400k total, of which at most 272k can be input
+    ("gpt-5", 272_000),
+    ("o1-mini", 128_000),
+    ("o1", 200_000),
+    ("o3", 200_000),
+    ("o4", 200_000),
+]
+
+
+def _context_window(model: str) -> int | None:
+    model = model.lower()
+    return next(
+        (window for prefix, window in _CONTEXT_WINDOWS if model.startswith(prefix)),
+        None,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding(model: str):
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+# System prompts and instruction blocks recur across calls; count each once.
+# Counts are keyed by a digest of the text so the cache never holds prompts.
+_TOKEN_COUNT_CACHE_SIZE = 4096
+_token_counts: collections.OrderedDict[tuple[str, bytes], int] = collections.OrderedDict()
+_token_counts_lock = threading.Lock()
+
+
+def _count_text_tokens(model: str, text: str) -> int:
+    key = (model, hashlib.blake2b(text.encode(), digest_size=16).digest())
+    with _token_counts_lock:
+        count = _token_counts.get(key)
+    if count is None:
+        count = len(_encoding(model).encode_ordinary(text))
+        with _token_counts_lock:
+            _token_counts[key] = count
+            if len(_token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+                _token_counts.popitem(last=False)
+    return count
+
+
+def _estimate_prompt_tokens(messages, model: str | None = None) -> int:
+    images = sum(
+        1
+        for msg in messages
+        if isinstance(msg.get("content"), list)
+        for part in msg["content"]
+        if part.get("type") in ("image_url", "image")
+    )
+    parts = _text_parts(messages)
+    if model is not None:
+        text_tokens = sum(_count_text_tokens(model, part) for part in parts)
+    else:
+        text_tokens = sum(map(len, parts)) // _CHARS_PER_TOKEN
+    return text_tokens + images * _TOKENS_PER_IMAGE
 
 
 class LM:
@@ -319,49 +928,83 @@ class LM:
         model: str,
         max_concurrency=10,
         default_kwargs=None,
+        semantic_cache_threshold: float | None = None,
+        embedding_model="text-embedding-3-small",
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
     ):
         self.model = model
         self.max_concurrency = max_concurrency
         self.semaphore = asyncio.Semaphore(max_concurrency)
         self.client = _get_client(model)
         self.default_kwargs = default_kwargs or {}
-        
-        # Check if model supports vision/images
-        # Most vision models have "vision", "gpt-4o", "gpt-4-turbo", "claude-3", "claude-sonnet-4" in the name
-        self.supports_vision = (
-            "vision" in model.lower() 
-            or "gpt-4o" in model.lower()
-            or "gpt-4-turbo" in model.lower()
-            or "claude-3" in model.lower()
-            or "claude-sonnet-4" in model.lower()
-            or "gemini" in model.lower()
+        # Opt-in: reuse replies to near-identical requests (OpenAI, no tools)
+        self.semantic_cache_threshold = semantic_cache_threshold
+        self.embedding_model = embedding_model
+        # Optional client-side pacing under the account's RPM/TPM limits, so
+        # bursts wait here instead of piling up 429 retries; max_concurrency
+        # still caps requests in flight.
+        self.rpm_limiter = (
+            _RateLimiter(requests_per_minute) if requests_per_minute else None
         )
+        self.tpm_limiter = (
+            _RateLimiter(tokens_per_minute) if tokens_per_minute else None
+        )
+        
+        self.supports_vision = bool(_VISION_RE.search(model))
 
     def is_openai(self) -> bool:
-        return isinstance(self.client, (openai.AsyncAzureOpenAI, openai.AsyncOpenAI))
+        # A client can only be from an SDK that has already been imported
+        openai = sys.modules.get("openai")
+        return openai is not None and isinstance(
+            self.client, (openai.AsyncAzureOpenAI, openai.AsyncOpenAI)
+        )
 
     def is_anthropic(self) -> bool:
-        return isinstance(self.client, anthropic.AsyncAnthropic)
+        anthropic = sys.modules.get("anthropic")
+        return anthropic is not None and isinstance(self.client, anthropic.AsyncAnthropic)
 
-    def image_url_content_piece(
-        self, image: PIL.Image.Image
+    async def image_url_content_piece(
+        self, image: PIL.Image.Image, detail="high"
     ) -> ChatCompletionContentPartImageParam:
+        """
+        `detail="low"` sends a downscaled JPEG instead of the full-size PNG,
+        for calls where the screenshot only needs to be roughly legible.
+        """
+        if not (self.is_openai() or self.is_anthropic()):
+            raise ValueError("Unknown client type.")
+        # Encoding takes tens of milliseconds per screenshot; run it on a
+        # worker thread so other in-flight LM calls keep making progress.
+        encoded = _cached_image_base64(image, detail)
+        if encoded is None:
+            encoded = await asyncio.to_thread(_image_base64, image, detail)
+        media_type = f"image/{_IMAGE_ENCODINGS[detail][0]}"
         if self.is_openai():
             return {
                 "type": "image_url",
-                "image_url": {"url": image_to_data_url(image), "detail": "high"},
+                "image_url": {
+                    "url": f"data:{media_type};base64,{encoded}",
+                    "detail": detail,
+                },
             }
         elif self.is_anthropic():
             return {
                 "type": "image",  # type: ignore
                 "source": {
                     "type": "base64",
-                    "media_type": "image/png",
-                    "data": image_to_base64(image),
+                    "media_type": media_type,
+                    "data": encoded,
                 },
             }
-        else:
-            raise ValueError("Unknown client type.")
+
+    def _combined_args(self, kwargs: dict) -> dict:
+        combined_args = {**self.default_kwargs, **kwargs}
+        # Consumed by LM.__call__, not an API argument
+        combined_args.pop("cache", None)
+        # Remove max_tokens for GPT models
+        if self.is_openai() and "gpt" in self.model.lower():
+            combined_args.pop("max_tokens", None)
+        return combined_args
 
     async def __call__(
         self,
@@ -371,14 +1014,173 @@ class LM:
         tools: list[Function] = [],
         key="general",
         **kwargs,
+    ) -> Any:
+        """
+        `json_schema` is a J-style schema dict or a Pydantic model class; with
+        a model class the reply is returned as an instance of it.
+
+        Pass `cache=True` to answer a temperature=0 call from the on-disk
+        response cache when an identical request has been answered before
+        (this is the default when SKILLWEAVER_LM_CACHE is set). If the LM was
+        built with a `semantic_cache_threshold`, temperature=0 calls without
+        tools are also answered from a previous reply to a request with the
+        same earlier turns and images whose last two messages' text is
+        sufficiently similar.
+        Pass `cache=False` to always query the API.
+
+        Pass `stream=True` for a plain-text call to get an async iterator
+        over the reply text as it is generated; streamed calls are not cached.
+        """
+        if kwargs.pop("stream", False):
+            if json_mode or json_schema is not None or len(tools) > 0:
+                raise ValueError("Only plain-text completions can be streamed.")
+            return self._stream(messages, key, self._combined_args(kwargs))
+
+        combined_args = self._combined_args(kwargs)
+        cache_key = None
+        if kwargs.get("cache", _response_cache_by_default):
+            cache_key = _response_cache_key(
+                self.model, messages, json_mode, json_schema, tools, combined_args
+            )
+        if cache_key is not None:
+            cached = await asyncio.to_thread(_response_cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+        semantic_scope = embedding = None
+        if (
+            kwargs.get("cache", True)
+            and self.semantic_cache_threshold is not None
+            and self.is_openai()
+            and len(tools) == 0
+            and combined_args.get("temperature") == 0
+        ):
+            # Only the text of the last two messages is compared by embedding;
+            # earlier turns and any screenshots must match exactly.
+            semantic_scope = _request_hash(
+                [
+                    self.model,
+                    json_mode,
+                    json_schema,
+                    combined_args,
+                    messages[:-2],
+                    _non_text_parts(messages[-2:]),
+                ]
+            )
+        if semantic_scope is not None:
+            embedding = await self._embed(_message_text(messages[-2:]))
+            cached = await asyncio.to_thread(
+                _semantic_cache.get, semantic_scope, embedding, self.semantic_cache_threshold
+            )
+            if cached is not None:
+                return cached
+
+        result = await self._complete(
+            messages, json_mode, json_schema, tools, key, combined_args
+        )
+        if cache_key is not None:
+            await asyncio.to_thread(_response_cache.set, cache_key, result)
+        if semantic_scope is not None:
+            await asyncio.to_thread(_semantic_cache.set, semantic_scope, embedding, result)
+        return result
+
+    async def batch(
+        self, batch: list[list[ChatCompletionMessageParam]], **kwargs
+    ) -> list[Any]:
+        """
+        Run independent calls with the same options concurrently (still
+        bounded by max_concurrency) and return their results in order.
+        """
+        return await asyncio.gather(*(self(messages, **kwargs) for messages in batch))
+
+    async def batch_as_completed(
+        self, batch: list[list[ChatCompletionMessageParam]], **kwargs
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Like `batch`, but yield (index, result) pairs as each call finishes."""
+
+        async def indexed(i, messages):
+            return i, await self(messages, **kwargs)
+
+        for next_done in asyncio.as_completed(
+            [indexed(i, messages) for i, messages in enumerate(batch)]
+        ):
+            yield await next_done
+
+    async def _embed(self, text: str):
+        import numpy as np
+
+        response = await self.client.embeddings.create(
+            model=self.embedding_model, input=text
+        )
+        embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return embedding / np.linalg.norm(embedding)
+
+    async def _wait_for_rate_limits(self, messages, combined_args: dict):
+        """
+        Reject OpenAI prompts that cannot fit the model's context window
+        before sending them, then wait for the rate limits, if any.
+        """
+        max_tokens = combined_args.get(
+            "max_completion_tokens", combined_args.get("max_tokens")
+        )
+        prompt_tokens = None
+        window = _context_window(self.model) if self.is_openai() else None
+        if window is not None:
+            # Tokenizing a large page state takes a while; keep it off the loop
+            prompt_tokens = await asyncio.to_thread(
+                _estimate_prompt_tokens, messages, self.model
+            )
+            if prompt_tokens + (max_tokens or 0) > window:
+                raise ValueError(
+                    f"Prompt of ~{prompt_tokens} tokens (plus {max_tokens or 0} "
+                    f"for the reply) exceeds {self.model}'s context window of {window}."
+                )
+
+        if self.rpm_limiter is not None:
+            await self.rpm_limiter.acquire()
+        if self.tpm_limiter is not None:
+            if prompt_tokens is None:
+                prompt_tokens = (
+                    await asyncio.to_thread(_estimate_prompt_tokens, messages, self.model)
+                    if self.is_openai()
+                    else _estimate_prompt_tokens(messages)
+                )
+            await self.tpm_limiter.acquire(prompt_tokens + (max_tokens or 1024))
+
+    async def _stream(
+        self,
+        messages: list[ChatCompletionMessageParam],
+        key: str,
+        combined_args: dict,
+    ) -> AsyncIterator[str]:
+        # The concurrency slot is held until the caller finishes reading
+        async with self.semaphore:
+            await self._wait_for_rate_limits(messages, combined_args)
+            if self.is_openai():
+                pieces = completion_openai_stream(
+                    self.client, self.model, messages, args=combined_args, key=key  # type: ignore
+                )
+            elif self.is_anthropic():
+                pieces = completion_anthropic_stream(
+                    self.client, self.model, messages, args=combined_args, key=key  # type: ignore
+                )
+            else:
+                raise ValueError(f"Unknown client type for model: {self.model}")
+            async for piece in pieces:
+                yield piece
+
+    async def _complete(
+        self,
+        messages: list[ChatCompletionMessageParam],
+        json_mode,
+        json_schema,
+        tools: list[Function],
+        key: str,
+        combined_args: dict,
     ) -> Any:
         async with self.semaphore:
+            await self._wait_for_rate_limits(messages, combined_args)
             if self.is_openai():
-                # Remove max_tokens for GPT models
-                combined_args = {**self.default_kwargs, **kwargs}
-                if "gpt" in self.model.lower():
-                    combined_args.pop("max_tokens", None)
-                
                 client_oai: openai.AsyncOpenAI | openai.AsyncAzureOpenAI = self.client  # type: ignore
                 return await completion_openai(
                     client_oai,
@@ -391,7 +1193,6 @@ class LM:
                     key=key,
                 )
             elif self.is_anthropic():
-                combined_args = {**self.default_kwargs, **kwargs}
                 client_anthropic: anthropic.AsyncAnthropic = self.client  # type: ignore
                 return await completion_anthropic(
                     client_anthropic,
@@ -412,11 +1213,201 @@ class LM:
         response_model: type[ResponseFormatT],
         **kwargs,
     ) -> ResponseFormatT:
-        result = await self.client.beta.chat.completions.parse(
-            messages=messages,
-            model=self.model,
-            response_format=response_model,
+        return await self(messages, json_schema=response_model, **kwargs)
+
+
+class _BatchItemFailed(Exception):
+    pass
+
+
+class BatchedLM(LM):
+    """
+    LM that coalesces concurrent calls into provider batch jobs.
+
+    Calls arriving within `flush_interval_ms` of each other are submitted as
+    one OpenAI Batch API job or Anthropic Message Batch, and each caller is
+    resolved from the batch results. Batch jobs trade latency (minutes, up to
+    the provider's completion window) for throughput and cost, so this is for
+    offline bulk work such as scoring many trajectories, not the interactive
+    agent loop. Calls with tools go through the regular path, as does any
+    sub-request that fails inside a batch, which keeps LM's retry/backoff.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        max_concurrency=10,
+        default_kwargs=None,
+        flush_interval_ms=50,
+        poll_interval=10.0,
+    ):
+        super().__init__(model, max_concurrency, default_kwargs)
+        self.flush_interval = flush_interval_ms / 1000
+        self.poll_interval = poll_interval
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+        # Strong references, so in-flight batches are not garbage collected
+        self._batch_tasks: set[asyncio.Task] = set()
+
+    async def __call__(
+        self,
+        messages: list[ChatCompletionMessageParam],
+        json_mode=False,
+        json_schema=None,
+        tools: list[Function] = [],
+        key="general",
+        **kwargs,
+    ) -> Any:
+        if (
+            len(tools) > 0
+            or kwargs.get("stream", False)
+            or _is_response_model(json_schema)
+            or not (self.is_openai() or self.is_anthropic())
+        ):
+            return await super().__call__(
+                messages, json_mode, json_schema, tools, key, **kwargs
+            )
+
+        request = {
+            "messages": messages,
+            "json_mode": json_mode,
+            "json_schema": json_schema,
+            "key": key,
+            "args": self._combined_args(kwargs),
+        }
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+            self._batch_tasks.add(self._flush_task)
+            self._flush_task.add_done_callback(self._batch_tasks.discard)
+
+        try:
+            return await future
+        except _BatchItemFailed as e:
+            await aioconsole.aprint(f"Batched request failed: {e}. Retrying unbatched...")
+            return await super().__call__(
+                messages, json_mode, json_schema, tools, key, **kwargs
+            )
+
+    async def _flush_after_interval(self):
+        await asyncio.sleep(self.flush_interval)
+        pending, self._pending = self._pending, []
+        self._flush_task = None
+
+        requests = {f"req-{i}": item for i, item in enumerate(pending)}
+        stopwatch = Stopwatch()
+        try:
+            if self.is_openai():
+                results = await self._run_openai_batch(requests)
+            else:
+                results = await self._run_anthropic_batch(requests)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(_BatchItemFailed(f"batch error: {e}"))
+            return
+        stopwatch.stop()
+
+        for custom_id, (request, future) in requests.items():
+            if future.done():
+                continue
+            if custom_id not in results:
+                future.set_exception(_BatchItemFailed(f"no result for {custom_id}"))
+                continue
+            monitor.log_elapsed("lm/" + request["key"], stopwatch)
+            try:
+                future.set_result(self._parse_result(request, results[custom_id]))
+            except Exception as e:
+                future.set_exception(_BatchItemFailed(repr(e)))
+
+    async def _run_openai_batch(self, requests: dict) -> dict:
+        client: openai.AsyncOpenAI | openai.AsyncAzureOpenAI = self.client  # type: ignore
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": request["messages"],
+                        "response_format": _openai_response_format(
+                            request["json_mode"], request["json_schema"]
+                        ),
+                        **request["args"],
+                    },
+                }
+            )
+            for custom_id, (request, _) in requests.items()
+        ]
+        batch_file = await client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)), purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
         )
-        parsed = result.choices[0].message.parsed
-        assert parsed is not None
-        return parsed
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(self.poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        results = {}
+        if batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                item = orjson.loads(line)
+                response = item.get("response")
+                if item.get("error") is None and response and response["status_code"] == 200:
+                    results[item["custom_id"]] = response["body"]
+        return results
+
+    async def _run_anthropic_batch(self, requests: dict) -> dict:
+        client: anthropic.AsyncAnthropic = self.client  # type: ignore
+        batch = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": _anthropic_call_args(
+                        self.model,
+                        request["messages"],
+                        request["json_schema"],
+                        request["args"],
+                    ),
+                }
+                for custom_id, (request, _) in requests.items()
+            ]  # type: ignore
+        )
+        while batch.processing_status != "ended":
+            await asyncio.sleep(self.poll_interval)
+            batch = await client.messages.batches.retrieve(batch.id)
+
+        results = {}
+        async for entry in await client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message
+        return results
+
+    def _parse_result(self, request: dict, result: Any) -> Any:
+        wants_json = request["json_mode"] or request["json_schema"] is not None
+        if self.is_openai():
+            usage = result["usage"]
+            monitor.log_token_usage(
+                request["key"],
+                "openai:" + self.model,
+                usage["prompt_tokens"],
+                usage["completion_tokens"],
+            )
+            content = result["choices"][0]["message"]["content"]
+            assert content is not None
+            return orjson.loads(content) if wants_json else content
+        else:
+            monitor.log_token_usage(
+                request["key"],
+                "anthropic:" + self.model,
+                result.usage.input_tokens,
+                result.usage.output_tokens,
+            )
+            content = result.content[0].text
+            return _parse_anthropic_json(content) if wants_json else content
@@ -3,14 +3,25 @@ import base64
 from io import BytesIO
 
 
-def image_to_base64(image: PIL.Image.Image, format="png"):
+def image_to_base64(
+    image: PIL.Image.Image, format="png", max_side: int | None = None, quality=None
+):
     image = image.convert("RGB")
+    if max_side is not None:
+        # convert() returned a copy, so shrinking it in place is safe
+        image.thumbnail((max_side, max_side), PIL.Image.LANCZOS)
     image_io = BytesIO()
-    image.save(image_io, format=format)
-    png_data = image_io.getvalue()
-    base64_image = base64.b64encode(png_data).decode("utf-8")
+    if quality is not None:
+        image.save(image_io, format=format, quality=quality, optimize=True)
+    else:
+        image.save(image_io, format=format)
+    image_data = image_io.getvalue()
+    base64_image = base64.b64encode(image_data).decode("utf-8")
     return base64_image
 
 
-def image_to_data_url(image: PIL.Image.Image, format="png"):
-    return f"data:image/png;base64,{image_to_base64(image, format=format)}"
+def image_to_data_url(
+    image: PIL.Image.Image, format="png", max_side: int | None = None, quality=None
+):
+    encoded = image_to_base64(image, format=format, max_side=max_side, quality=quality)
+    return f"data:image/{format.lower()};base64,{encoded}"
@@ -1,3 +1,5 @@
+import time
+
 # Costs in USD.
 __COSTS__ = {
     "openai:gpt-4o": {
@@ -19,6 +21,28 @@ __COSTS__ = {
 }
 
 
+class Stopwatch:
+    """
+    Times a span with the monotonic clock, which NTP adjustments cannot skew,
+    while keeping the wall-clock start for placing events on a timeline.
+    """
+
+    def __init__(self):
+        self.start_time = time.time()
+        self._start_ns = time.perf_counter_ns()
+        self._stop_ns: int | None = None
+
+    def stop(self):
+        if self._stop_ns is None:
+            self._stop_ns = time.perf_counter_ns()
+        return self
+
+    @property
+    def duration(self) -> float:
+        stop_ns = self._stop_ns if self._stop_ns is not None else time.perf_counter_ns()
+        return (stop_ns - self._start_ns) / 1e9
+
+
 class PerformanceMonitoring:
     def __init__(self):
         self.timing_events = []
@@ -34,6 +58,17 @@ class PerformanceMonitoring:
             }
         )
 
+    def log_elapsed(self, key: str, stopwatch: Stopwatch):
+        duration = stopwatch.duration
+        self.timing_events.append(
+            {
+                "key": key,
+                "start_time": stopwatch.start_time,
+                "end_time": stopwatch.start_time + duration,
+                "duration": duration,
+            }
+        )
+
     def log_token_usage(
         self, key: str, model: str, input_tokens: int, output_tokens: int
     ):